@@ -21,6 +21,10 @@ REDIS_URL = os.getenv(
     f"redis://{REDIS_USERNAME}:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/0",
 )
 
+# Redis connection pool settings
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+REDIS_POOL_TIMEOUT = int(os.getenv("REDIS_POOL_TIMEOUT", 20))
+
 # JWT
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 
@@ -28,9 +32,87 @@ JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 INTERVIEW_DURATION = os.getenv("INTERVIEW_DURATION")
 FEEDBACK_DELAY = int(os.getenv("FEEDBACK_DELAY", 5))
 
+# Seconds interview state is kept in Redis while active, renewed on each turn,
+# once ended, and once the report is published
+INTERVIEW_TTL = int(os.getenv("INTERVIEW_TTL", 24 * 60 * 60))
+INTERVIEW_ENDED_TTL = int(os.getenv("INTERVIEW_ENDED_TTL", 7 * 24 * 60 * 60))
+INTERVIEW_PUBLISHED_TTL = int(os.getenv("INTERVIEW_PUBLISHED_TTL", 24 * 60 * 60))
+
+# Reaper evicting interviews whose report was published: seconds between runs,
+# seconds to keep an interview after publishing, and interviews per run
+REAPER_INTERVAL = int(os.getenv("REAPER_INTERVAL", 10 * 60))
+REAPER_GRACE = int(os.getenv("REAPER_GRACE", 60 * 60))
+REAPER_BATCH = int(os.getenv("REAPER_BATCH", 100))
+
+# Report generation jobs: seconds of the lease on a job, renewed while it runs,
+# and seconds before a failed job is retried
+REPORT_LEASE_TTL = float(os.getenv("REPORT_LEASE_TTL", 30))
+REPORT_RETRY_DELAY = int(os.getenv("REPORT_RETRY_DELAY", 60))
+
+# Number of question/answer pairs scored concurrently per report
+FEEDBACK_CONCURRENCY = int(os.getenv("FEEDBACK_CONCURRENCY", 4))
+
+# Score each answer in the background while the interview is running
+INCREMENTAL_FEEDBACK = (os.getenv("INCREMENTAL_FEEDBACK") or "false").lower() == "true"
+
+# Retry policy of feedback LLM calls, timeout and budget in seconds
+FEEDBACK_MAX_ATTEMPTS = int(os.getenv("FEEDBACK_MAX_ATTEMPTS", 3))
+FEEDBACK_ATTEMPT_TIMEOUT = float(os.getenv("FEEDBACK_ATTEMPT_TIMEOUT", 60))
+FEEDBACK_RETRY_BUDGET = float(os.getenv("FEEDBACK_RETRY_BUDGET", 180))
+
+# In-process cache of chat sessions, TTL and seconds between stats logs
+SESSION_CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", 1000))
+SESSION_CACHE_TTL = int(os.getenv("SESSION_CACHE_TTL", 300))
+SESSION_CACHE_STATS_INTERVAL = int(os.getenv("SESSION_CACHE_STATS_INTERVAL", 300))
+
+# Conversation turns kept verbatim in the prompt, older turns are folded into a
+# rolling summary, 0 keeps the whole history. Optional limits per interview
+# type given as "type=turns,type=turns", e.g. "job=6"
+HISTORY_WINDOW = int(os.getenv("HISTORY_WINDOW", 10))
+HISTORY_TYPE_WINDOW = {
+    type.strip(): int(turns)
+    for type, turns in (
+        item.split("=")
+        for item in os.getenv("HISTORY_TYPE_WINDOW", "").split(",")
+        if item.strip()
+    )
+}
+
+# Archive of interviews evicted from Redis, "local" or "none", where local
+# archives are written to segments of up to ARCHIVE_SEGMENT_SIZE bytes under
+# ARCHIVE_PATH, a persistent volume shared by every replica. Published
+# interviews are only evicted while an archive is configured, otherwise they
+# keep INTERVIEW_ENDED_TTL.
+ARCHIVE_BACKEND = os.getenv("ARCHIVE_BACKEND", "none").lower()
+ARCHIVE_PATH = os.getenv("ARCHIVE_PATH")
+ARCHIVE_SEGMENT_SIZE = int(os.getenv("ARCHIVE_SEGMENT_SIZE", 64 * 1024 * 1024))
+
+# Shared HTTP client: connection pool size and request timeout in seconds
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 100))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 30))
+
+# Resume PDF download size limit in bytes
+PDF_MAX_SIZE = int(os.getenv("PDF_MAX_SIZE", 10 * 1024 * 1024))
+
+# Resume PDF parsing: worker processes, timeout and text cache TTL in seconds
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", 2))
+PDF_TIMEOUT = float(os.getenv("PDF_TIMEOUT", 30))
+PDF_CACHE_TTL = int(os.getenv("PDF_CACHE_TTL", 7 * 24 * 60 * 60))
+
 # Model
 MODEL = os.getenv("MODEL") or os.getenv("CONVERSATION_SERVICE_MODEL")
 
+# Ollama: how long the model, and its prompt cache, stays loaded between
+# requests, and the context size, shared by every client so the model is
+# never reloaded with other options
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+OLLAMA_NUM_CTX = int(os.getenv("OLLAMA_NUM_CTX", 8192))
+
+# LLM client: connection pool size, and seconds to wait for the model to load
+# on startup
+LLM_POOL_SIZE = int(os.getenv("LLM_POOL_SIZE", 20))
+LLM_WARM_UP_TIMEOUT = float(os.getenv("LLM_WARM_UP_TIMEOUT", 60))
+
 # Groq settings
 USE_GROQ = (
     os.getenv("USE_GROQ") or os.getenv("CONVERSATION_SERVICE_USE_GROQ") or "false"
@@ -77,6 +159,23 @@ SERVICE_NAME = os.getenv("SERVICE_NAME", "CONVERSATION_SERVICE")
 SERVICE_QUEUE = os.getenv("CONVERSATION_QUEUE", "CONVERSATION_QUEUE")
 RPC_QUEUE = os.getenv("CONVERSATION_RPC", "CONVERSATION_RPC")
 
+# Events prefetched and handled at once, with optional limits per event type
+# given as "TYPE=limit,TYPE=limit", e.g. "GENERATE_REPORT=4"
+EVENT_PREFETCH = int(os.getenv("EVENT_PREFETCH", 10))
+EVENT_CONCURRENCY = int(os.getenv("EVENT_CONCURRENCY", 10))
+EVENT_TYPE_CONCURRENCY = {
+    type.strip(): int(limit)
+    for type, limit in (
+        item.split("=")
+        for item in os.getenv("EVENT_TYPE_CONCURRENCY", "").split(",")
+        if item.strip()
+    )
+}
+
+# Concurrent RPC requests handled, and seconds to drain them on shutdown
+RPC_CONCURRENCY = int(os.getenv("RPC_CONCURRENCY", 10))
+RPC_DRAIN_TIMEOUT = float(os.getenv("RPC_DRAIN_TIMEOUT", 10))
+
 USER_QUEUE = os.getenv("USER_QUEUE")
 USER_RPC = os.getenv("USER_RPC")
 INTERVIEW_QUEUE = os.getenv("INTERVIEW_QUEUE")
@@ -115,6 +214,9 @@ if SPEECH_PROVIDERS and "aws" in SPEECH_PROVIDERS.lower():
         }
     )
 
+if ARCHIVE_BACKEND == "local":
+    _imported_variable.update({"ARCHIVE_PATH": ARCHIVE_PATH})
+
 if not all(_imported_variable.values()):
     missing_variables = [key for key, value in _imported_variable.items() if not value]
     raise ValueError(f"Missing environment variables: {missing_variables}")
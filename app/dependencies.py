@@ -1,23 +1,17 @@
-from typing import Annotated
+from typing import Annotated, Union
 
 import jwt
-from fastapi import Header
+from fastapi import Header, WebSocket, WebSocketException, status
 
 from app import ENV, JWT_SECRET_KEY
 from app.utils.errors import UnauthorizedException401
 
 
-# Autorization header
-async def authorize(
-    authorization: Annotated[str, Header()] = None,
-    swagger_authorization: Annotated[str, Header()] = None,
-) -> str:
-    """Authorize requests."""
+def _get_user_id(token: str) -> str:
+    """Get the user ID from a JWT token."""
     credentials_exception = UnauthorizedException401("Could not validate credentials.")
 
     try:
-        auth = authorization or swagger_authorization
-        token = auth.split(" ")[1]
         payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=["HS256"])
         user_id = payload.get("sub")
         if not user_id:
@@ -31,6 +25,59 @@ async def authorize(
     return user_id
 
 
+# Autorization header
+async def authorize(
+    authorization: Annotated[str, Header()] = None,
+    swagger_authorization: Annotated[str, Header()] = None,
+) -> str:
+    """Authorize requests."""
+    try:
+        auth = authorization or swagger_authorization
+        token = auth.split(" ")[1]
+    except Exception:
+        token = None
+
+    return _get_user_id(token)
+
+
+# Browsers cannot set headers on websockets, so the token may be sent as a
+# subprotocol, ["bearer", token], rather than in the URL, which is logged
+WEBSOCKET_SUBPROTOCOL = "bearer"
+
+
+def _get_websocket_token(websocket: WebSocket) -> Union[str, None]:
+    """Get the token of a websocket from its authorization or subprotocol header."""
+    try:
+        return websocket.headers.get("authorization").split(" ")[1]
+    except Exception:
+        pass
+
+    protocols = [
+        protocol.strip()
+        for protocol in websocket.headers.get("sec-websocket-protocol", "").split(",")
+    ]
+    if WEBSOCKET_SUBPROTOCOL in protocols[:-1]:
+        return protocols[protocols.index(WEBSOCKET_SUBPROTOCOL) + 1]
+
+    return None
+
+
+async def authorize_websocket(websocket: WebSocket) -> str:
+    """Authorize websocket connections."""
+    try:
+        return _get_user_id(_get_websocket_token(websocket))
+    except UnauthorizedException401 as err:
+        raise WebSocketException(status.WS_1008_POLICY_VIOLATION, err.message)
+
+
+def get_websocket_subprotocol(websocket: WebSocket) -> Union[str, None]:
+    """Get the subprotocol to accept, the bearer one if the client offered it."""
+    if WEBSOCKET_SUBPROTOCOL in websocket.scope.get("subprotocols", []):
+        return WEBSOCKET_SUBPROTOCOL
+
+    return None
+
+
 async def authorize_interview():
     """Authorize interview requests."""
     pass
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import re
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -8,32 +9,59 @@ from fastapi.middleware.cors import CORSMiddleware
 from app import ENV, SERVICE_QUEUE
 from app.app_v1 import app as app_v1
 from app.services.broker import Broker, EventService, RPCService
+from app.services.chat import ChatService
 from app.services.events import EventsService
+from app.services.lifecycle import LifecycleService
 from app.services.redis import RedisService
+from app.utils.http import HttpClient
+from app.utils.llm import LLMClient
+from app.utils.pdf_text import close_executor
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s:\t  %(message)s")
 logging.getLogger("uvicorn.access").addFilter(
     lambda record: "GET / " not in record.getMessage()
 )
 
+_TOKEN_PARAM = re.compile(r"((?:^|[?&])token=)[^&\s\"]*")
+
+
+def _scrub_token(record: logging.LogRecord) -> bool:
+    """Hide tokens sent in query strings by older websocket clients."""
+    message = record.getMessage()
+    if "token=" in message:
+        record.msg, record.args = _TOKEN_PARAM.sub(r"\1***", message), ()
+    return True
+
+
+logging.getLogger("uvicorn.access").addFilter(_scrub_token)
+logging.getLogger("uvicorn.error").addFilter(_scrub_token)
+
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     RedisService.connect()
+    await HttpClient.connect()
     await Broker.connect()
+    await LLMClient.warm_up()
     logging.info(f"Serving in {ENV} environment")
 
     tasks = [
         EventService.subscribe(SERVICE_QUEUE, EventsService),
         RPCService.respond(EventsService),
+        LifecycleService.run_reaper(),
+        ChatService.log_cache_stats(),
     ]
     tasks = [asyncio.create_task(task) for task in tasks]
 
     yield
 
     [task.cancel() for task in tasks]
-    RedisService.disconnect()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await RedisService.disconnect()
+    await RPCService.close()
     await Broker.close()
+    await HttpClient.close()
+    close_executor()
 
 
 app = FastAPI(
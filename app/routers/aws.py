@@ -22,4 +22,4 @@ aws_service = AwsService()
     responses={**InternalServerErrorResponse, **BadRequestResponse},
 )
 async def credentials(interview_id: str) -> AwsResponse:
-    return aws_service.generate_credentials(interview_id)
+    return await aws_service.generate_credentials(interview_id)
@@ -22,4 +22,4 @@ azure_service = AzureService()
     responses={**InternalServerErrorResponse, **BadRequestResponse},
 )
 async def token() -> AzureResponse:
-    return azure_service.generate_token()
+    return await azure_service.generate_token()
@@ -1,27 +1,52 @@
-from typing import Annotated
+import asyncio
+import base64
+import logging
+from typing import Annotated, AsyncIterator, Union
 
-from fastapi import APIRouter, Depends
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
 
-from app.dependencies import authorize
+from app import INCREMENTAL_FEEDBACK
+from app.dependencies import (
+    authorize,
+    authorize_websocket,
+    get_websocket_subprotocol,
+)
 from app.services.chat import ChatService
 from app.services.feedback import FeedbackService
 from app.services.interview import InterviewService
+from app.services.report import ReportService
 from app.types.conversation_response import (
+    CompactInterviewDetailsResponse,
     ConversationResponse,
     InterviewDetailsResponse,
 )
 from app.types.interview_report_response import InterviewReportResponse
+from app.types.message_chunk_response import MessageChunkResponse, MessageChunkType
 from app.types.message_request import MessageRequest
 from app.types.message_response import MessageResponse
+from app.types.report_job_response import ReportJobResponse
 from app.utils.errors import (
     BadRequestException400,
     BadRequestResponse,
+    BaseException,
     InternalServerErrorException500,
     InternalServerErrorResponse,
     NotFoundException404,
     NotFoundResponse,
 )
-from app.utils.timer import timer
+from app.utils.timer import check_timer, timer
+
+_MAX_PAGE_SIZE = 1000
+"""Most transcript messages returned per page."""
 
 router = APIRouter(
     prefix="/conversations",
@@ -48,12 +73,13 @@ async def start_conversation(
         raise InternalServerErrorException500()
 
     chat_service = ChatService(interview_id, user_id)
+    await chat_service.create_session(
+        interview_service.job_description,
+        interview_service.resume,
+        interview_service.interview_type,
+    )
 
-    if chat_service.is_active():
-        raise BadRequestException400("Interview already started.")
-
-    chat_service.set_active()
-    await interview_service.publish_interview_started()
+    await chat_service.set_active()
     return await chat_service.start()
 
 
@@ -66,9 +92,127 @@ async def continue_conversation(
     interview_id: str,
     message: MessageRequest,
     user_id: Annotated[str, Depends(authorize)],
+    background_tasks: BackgroundTasks,
 ) -> MessageResponse:
     chat_service = ChatService(interview_id, user_id)
-    return chat_service.invoke(message.message)
+    await chat_service.initialize()
+    response = await chat_service.invoke(message.message)
+
+    background_tasks.add_task(chat_service.update_summary)
+    if INCREMENTAL_FEEDBACK:
+        background_tasks.add_task(FeedbackService.score_answers, interview_id)
+
+    return response
+
+
+async def _to_event_stream(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Format streamed reply chunks as server-sent events."""
+    reply = []
+
+    try:
+        async for chunk in chunks:
+            reply.append(chunk)
+            event = MessageChunkResponse(type=MessageChunkType.CHUNK, message=chunk)
+            yield f"event: {event.type}\ndata: {event.model_dump_json()}\n\n"
+
+        event = MessageChunkResponse(type=MessageChunkType.END, message="".join(reply))
+    except Exception as err:
+        logging.error(f"Error streaming reply: {err}")
+        event = MessageChunkResponse(type=MessageChunkType.ERROR, message="")
+
+    yield f"event: {event.type}\ndata: {event.model_dump_json()}\n\n"
+
+
+@router.post(
+    "/continue/{interview_id}/stream",
+    responses={**BadRequestResponse, **NotFoundResponse},
+    response_class=StreamingResponse,
+)
+@timer
+async def stream_conversation(
+    interview_id: str,
+    message: MessageRequest,
+    user_id: Annotated[str, Depends(authorize)],
+    background_tasks: BackgroundTasks,
+    sentences: bool = False,
+):
+    chat_service = ChatService(interview_id, user_id)
+    await chat_service.initialize()
+    chunks = await chat_service.stream(message.message, sentences)
+
+    # Background tasks run once the stream, and so the turn, is complete
+    background_tasks.add_task(chat_service.update_summary)
+    if INCREMENTAL_FEEDBACK:
+        background_tasks.add_task(FeedbackService.score_answers, interview_id)
+
+    return StreamingResponse(
+        _to_event_stream(chunks),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws/{interview_id}")
+async def conversation_websocket(
+    websocket: WebSocket,
+    interview_id: str,
+    user_id: Annotated[str, Depends(authorize_websocket)],
+    sentences: bool = False,
+):
+    await websocket.accept(subprotocol=get_websocket_subprotocol(websocket))
+    turn_tasks = set()
+
+    try:
+        chat_service = ChatService(interview_id, user_id)
+        await chat_service.initialize()
+
+        while True:
+            try:
+                message = MessageRequest.model_validate(await websocket.receive_json())
+            except ValidationError:
+                raise BadRequestException400("Invalid message.")
+
+            await check_timer(interview_id)
+
+            reply = []
+            async for chunk in await chat_service.stream(message.message, sentences):
+                reply.append(chunk)
+                await websocket.send_json(
+                    MessageChunkResponse(
+                        type=MessageChunkType.CHUNK, message=chunk
+                    ).model_dump()
+                )
+
+            await websocket.send_json(
+                MessageChunkResponse(
+                    type=MessageChunkType.END, message="".join(reply)
+                ).model_dump()
+            )
+
+            tasks = [asyncio.create_task(chat_service.update_summary())]
+            if INCREMENTAL_FEEDBACK:
+                tasks.append(
+                    asyncio.create_task(FeedbackService.score_answers(interview_id))
+                )
+
+            for task in tasks:
+                turn_tasks.add(task)
+                task.add_done_callback(turn_tasks.discard)
+    except WebSocketDisconnect:
+        return
+    except BaseException as err:
+        await websocket.send_json(
+            MessageChunkResponse(
+                type=MessageChunkType.ERROR, message=err.message
+            ).model_dump()
+        )
+        await websocket.close()
+    except Exception as err:
+        logging.error(f"Error streaming reply: {err}")
+        await websocket.send_json(
+            MessageChunkResponse(type=MessageChunkType.ERROR, message="").model_dump()
+        )
+        await websocket.close()
 
 
 @router.post(
@@ -80,6 +224,7 @@ async def end_conversation(
 ):
     interview_service = InterviewService(interview_id, user_id)
     chat_service = ChatService(interview_id, user_id)
+    await chat_service.initialize()
 
     await interview_service.publish_interview_completed()
     await chat_service.end()
@@ -87,25 +232,82 @@ async def end_conversation(
     return "Interview ended."
 
 
-@router.get("/details/{interview_id}", responses={**NotFoundResponse})
+def _encode_cursor(index: int) -> str:
+    """Encode a transcript index as an opaque cursor."""
+    return base64.urlsafe_b64encode(str(index).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> int:
+    """Decode a cursor into a transcript index."""
+    try:
+        index = int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except ValueError:
+        raise BadRequestException400("Invalid cursor.")
+
+    if index < 0:
+        raise BadRequestException400("Invalid cursor.")
+    return index
+
+
+@router.get(
+    "/details/{interview_id}", responses={**BadRequestResponse, **NotFoundResponse}
+)
 async def get_interview_details(
-    interview_id: str, user_id: Annotated[str, Depends(authorize)]
-) -> InterviewDetailsResponse:
-    messages = InterviewService(interview_id, user_id).get_conversation()
-    if not messages:
+    interview_id: str,
+    user_id: Annotated[str, Depends(authorize)],
+    cursor: Annotated[
+        str, Query(description="Cursor of the page, from the previous page.")
+    ] = None,
+    since: Annotated[
+        int,
+        Query(ge=0, description="Index to start from, the messages already read."),
+    ] = None,
+    limit: Annotated[
+        int,
+        Query(ge=1, le=_MAX_PAGE_SIZE, description="Messages per page, all if unset."),
+    ] = None,
+    compact: Annotated[
+        bool, Query(description="Return messages as type and message pairs.")
+    ] = False,
+) -> Union[InterviewDetailsResponse, CompactInterviewDetailsResponse]:
+    start = _decode_cursor(cursor) if cursor else since or 0
+
+    page = await InterviewService(interview_id, user_id).get_conversation_page(
+        start, limit
+    )
+    if page is None:
         raise NotFoundException404("Interview not found.")
 
-    conversation = [ConversationResponse.from_message(message) for message in messages]
+    pairs, has_more = page
+    next_cursor = _encode_cursor(start + len(pairs)) if has_more else None
+
+    if compact:
+        return CompactInterviewDetailsResponse(
+            interview_id=interview_id, conversations=pairs, next_cursor=next_cursor
+        )
+
     return InterviewDetailsResponse(
-        interview_id=interview_id, conversations=conversation
+        interview_id=interview_id,
+        conversations=[ConversationResponse.from_pair(*pair) for pair in pairs],
+        next_cursor=next_cursor,
     )
 
 
 @router.get(
-    "/report/{interview_id}", responses={**NotFoundResponse, **BadRequestResponse}
+    "/report/{interview_id}",
+    responses={
+        202: {"model": ReportJobResponse},
+        **NotFoundResponse,
+        **BadRequestResponse,
+    },
 )
 async def get_interview_report(
     interview_id: str, user_id: Annotated[str, Depends(authorize)]
 ) -> InterviewReportResponse:
-    feedback_service = FeedbackService(interview_id)
-    return feedback_service.get_feedback()
+    report = await ReportService.get_report(interview_id)
+
+    # Still being generated, the job tracks its progress
+    if isinstance(report, ReportJobResponse):
+        return JSONResponse(status_code=202, content=report.model_dump())
+
+    return report
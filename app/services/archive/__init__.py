@@ -0,0 +1,3 @@
+from .archive import ArchiveService
+from .base import ArchiveBackend
+from .local import LocalArchive
@@ -0,0 +1,81 @@
+import asyncio
+import json
+import time
+from typing import Union
+
+from langchain_core.messages import BaseMessage, messages_from_dict, messages_to_dict
+
+from app import ARCHIVE_BACKEND, ARCHIVE_PATH, ARCHIVE_SEGMENT_SIZE
+from app.services.chat_history import ChatHistoryService
+from app.services.redis import RedisService
+
+from .base import ArchiveBackend
+from .local import LocalArchive
+
+
+class ArchiveService:
+    """Service for archiving finished interviews out of Redis."""
+
+    _backend: Union[ArchiveBackend, None] = None
+
+    @classmethod
+    def get_backend(cls) -> Union[ArchiveBackend, None]:
+        """Get the configured archive backend, None if archiving is disabled."""
+        if cls._backend is None and ARCHIVE_BACKEND == "local":
+            cls._backend = LocalArchive(ARCHIVE_PATH, ARCHIVE_SEGMENT_SIZE)
+
+        return cls._backend
+
+    @staticmethod
+    async def _get_record(interview_id: str) -> Union[dict, None]:
+        """Get the transcript and report of an interview from Redis."""
+        messages, details = await asyncio.gather(
+            ChatHistoryService.get_messages(interview_id),
+            RedisService.get_details(
+                interview_id,
+                RedisService.Namespace.USER,
+                RedisService.Namespace.INTERVIEW_TYPE,
+                RedisService.Namespace.FEEDBACK,
+            ),
+        )
+
+        if not messages:
+            return None
+
+        feedback = details[RedisService.Namespace.FEEDBACK]
+        return {
+            "interview_id": interview_id,
+            "user_id": details[RedisService.Namespace.USER],
+            "interview_type": details[RedisService.Namespace.INTERVIEW_TYPE],
+            "messages": messages_to_dict(messages),
+            "feedback": json.loads(feedback) if feedback else None,
+            "archived_at": time.time(),
+        }
+
+    @classmethod
+    async def archive(cls, interview_ids: list[str]) -> None:
+        """Archive the interviews, raising if they could not be written."""
+        backend = cls.get_backend()
+        if backend is None:
+            return
+
+        records = await asyncio.gather(
+            *(cls._get_record(interview_id) for interview_id in interview_ids)
+        )
+        records = [record for record in records if record]
+        if records:
+            await backend.write(records)
+
+    @classmethod
+    async def get_messages(cls, interview_id: str) -> list[BaseMessage]:
+        """Get the archived messages of an interview."""
+        backend = cls.get_backend()
+        record = await backend.read(interview_id) if backend else None
+        return messages_from_dict(record["messages"]) if record else []
+
+    @classmethod
+    async def get_feedback(cls, interview_id: str) -> Union[dict, None]:
+        """Get the archived report of an interview."""
+        backend = cls.get_backend()
+        record = await backend.read(interview_id) if backend else None
+        return record["feedback"] if record else None
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Union
+
+
+class ArchiveBackend(ABC):
+    """Storage of finished interviews, read when their Redis state is gone."""
+
+    @abstractmethod
+    async def write(self, records: list[dict]) -> None:
+        """Write interview records, each keyed by its interview_id."""
+
+    @abstractmethod
+    async def read(self, interview_id: str) -> Union[dict, None]:
+        """Read the latest record of an interview, None if not archived."""
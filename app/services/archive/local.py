@@ -0,0 +1,128 @@
+import asyncio
+import fcntl
+import gzip
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Union
+
+from .base import ArchiveBackend
+
+
+class LocalArchive(ArchiveBackend):
+    """Archive of compressed JSON Lines segments on the local filesystem.
+
+    Every record is its own gzip member, so a segment stays a valid .jsonl.gz
+    file while a record can be read alone from the offset and length kept in
+    the index. Writers on the same directory are serialised with a file lock.
+    """
+
+    _INDEX_FILE = "index.jsonl"
+    _LOCK_FILE = ".lock"
+    _SEGMENT_GLOB = "segment-*.jsonl.gz"
+
+    def __init__(self, path: str, segment_size: int):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+
+        self._index: dict[str, tuple[str, int, int]] = {}
+        """Segment, offset and length of each record, by interview ID."""
+
+        self._index_position = 0
+        """Bytes of the index file already loaded."""
+
+        self._lock = threading.Lock()
+
+    async def write(self, records: list[dict]) -> None:
+        await asyncio.to_thread(self._write, records)
+
+    async def read(self, interview_id: str) -> Union[dict, None]:
+        return await asyncio.to_thread(self._read, interview_id)
+
+    @contextmanager
+    def _file_lock(self):
+        """Lock the archive against writers in other processes."""
+        with open(self.path / self._LOCK_FILE, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _get_segment(self) -> Path:
+        """Get the segment to append to, starting a new one once full."""
+        segments = sorted(self.path.glob(self._SEGMENT_GLOB))
+        if segments and segments[-1].stat().st_size < self.segment_size:
+            return segments[-1]
+
+        number = (
+            int(segments[-1].name.split("-")[1].split(".")[0]) + 1 if segments else 0
+        )
+        return self.path / f"segment-{number:06d}.jsonl.gz"
+
+    def _write(self, records: list[dict]) -> None:
+        with self._lock, self._file_lock():
+            segment = self._get_segment()
+            entries = []
+
+            with open(segment, "ab") as file:
+                file.seek(0, os.SEEK_END)
+                for record in records:
+                    data = gzip.compress((json.dumps(record) + "\n").encode("utf-8"))
+                    entries.append(
+                        {
+                            "interview_id": record["interview_id"],
+                            "segment": segment.name,
+                            "offset": file.tell(),
+                            "length": len(data),
+                        }
+                    )
+                    file.write(data)
+
+                file.flush()
+                os.fsync(file.fileno())
+
+            # The index is written last, so it only points at complete records
+            with open(self.path / self._INDEX_FILE, "a", encoding="utf-8") as index:
+                index.writelines(json.dumps(entry) + "\n" for entry in entries)
+                index.flush()
+                os.fsync(index.fileno())
+
+    def _load_index(self) -> None:
+        """Load the index entries appended since the last load, by any process."""
+        index_path = self.path / self._INDEX_FILE
+        if not index_path.exists():
+            return
+
+        with open(index_path, "rb") as index:
+            index.seek(self._index_position)
+            for line in iter(index.readline, b""):
+                # A line still being written is loaded on the next call
+                if not line.endswith(b"\n"):
+                    break
+
+                entry = json.loads(line)
+                self._index[entry["interview_id"]] = (
+                    entry["segment"],
+                    entry["offset"],
+                    entry["length"],
+                )
+                self._index_position += len(line)
+
+    def _read(self, interview_id: str) -> Union[dict, None]:
+        with self._lock:
+            if interview_id not in self._index:
+                self._load_index()
+
+            entry = self._index.get(interview_id)
+
+        if entry is None:
+            return None
+
+        segment, offset, length = entry
+        with open(self.path / segment, "rb") as file:
+            file.seek(offset)
+            return json.loads(gzip.decompress(file.read(length)))
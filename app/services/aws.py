@@ -15,10 +15,12 @@ class AwsService:
         if "aws" not in SPEECH_PROVIDERS:
             raise BadRequestException400("AWS service is not active.")
 
-    def generate_credentials(self, interview_id: str = "") -> AwsResponse:
+    async def generate_credentials(self, interview_id: str = "") -> AwsResponse:
         """Generate credentials."""
         self._validate_aws_service()
-        credentials = self.aws_credentials_generator.generate_credentials(interview_id)
+        credentials = await self.aws_credentials_generator.generate_credentials(
+            interview_id
+        )
 
         if not credentials:
             raise InternalServerErrorException500("Failed to generate credentials.")
@@ -15,10 +15,10 @@ class AzureService:
         if "azure" not in SPEECH_PROVIDERS:
             raise BadRequestException400("Azure service is not active.")
 
-    def generate_token(self) -> AzureResponse:
+    async def generate_token(self) -> AzureResponse:
         """Generate token."""
         self._validate_azure_service()
-        token = self.azure_token_generator.generate_token()
+        token = await self.azure_token_generator.generate_token()
 
         if not token:
             raise InternalServerErrorException500("Failed to generate token.")
@@ -1,9 +1,17 @@
+import asyncio
+import contextlib
 import json
 import logging
 
 import aio_pika
 
-from app import EXCHANGE_NAME, SERVICE_QUEUE
+from app import (
+    EVENT_CONCURRENCY,
+    EVENT_PREFETCH,
+    EVENT_TYPE_CONCURRENCY,
+    EXCHANGE_NAME,
+    SERVICE_QUEUE,
+)
 from app.services.broker import Broker
 
 
@@ -89,7 +97,13 @@ class EventService:
             logging.error(f"Failed to publish event: {err}")
 
     @staticmethod
-    async def subscribe(service: str, subscriber):
+    async def subscribe(
+        service: str,
+        subscriber,
+        prefetch_count: int = EVENT_PREFETCH,
+        concurrency: int = EVENT_CONCURRENCY,
+        type_concurrency: dict[str, int] = EVENT_TYPE_CONCURRENCY,
+    ):
         """
         Subscribe to events from a service
 
@@ -99,6 +113,13 @@ class EventService:
             The service to subscribe to
         subscriber : class or object
             The service subscriber with a handle_event method
+        prefetch_count : int, optional
+            The number of unacknowledged events delivered, by default EVENT_PREFETCH
+        concurrency : int, optional
+            The number of events handled at once, by default EVENT_CONCURRENCY
+        type_concurrency : dict[str, int], optional
+            The number of events of a type handled at once, by default
+            EVENT_TYPE_CONCURRENCY
 
         Returns
         -------
@@ -113,10 +134,15 @@ class EventService:
         ...
         >>> await EventService.subscribe("service", Subscriber)
         """
+        semaphore = asyncio.Semaphore(concurrency)
+        type_semaphores = {
+            type: asyncio.Semaphore(limit) for type, limit in type_concurrency.items()
+        }
+
         try:
             connection = await Broker.connect()
             channel = await connection.channel()
-            await channel.set_qos(prefetch_count=1)
+            await channel.set_qos(prefetch_count=prefetch_count)
             exchange = await channel.declare_exchange(
                 EXCHANGE_NAME,
                 aio_pika.ExchangeType.DIRECT,
@@ -133,7 +159,12 @@ class EventService:
                 async with message.process(ignore_processed=True):
                     try:
                         data = json.loads(message.body)
-                        await subscriber.handle_event(data)
+                        # Wait on the type limit first so other types are not held up
+                        async with type_semaphores.get(
+                            data.get("type"), contextlib.nullcontext()
+                        ):
+                            async with semaphore:
+                                await subscriber.handle_event(data)
                         await message.ack()
                     except Exception as process_error:
                         logging.error(f"Error processing message: {process_error}")
@@ -5,7 +5,7 @@ import uuid
 
 import aio_pika
 
-from app import RPC_QUEUE
+from app import RPC_CONCURRENCY, RPC_DRAIN_TIMEOUT, RPC_QUEUE
 from app.services.broker import Broker
 from app.utils.errors import RequestTimeoutException408
 
@@ -43,6 +43,37 @@ class RPCService:
             "data": data,
         }
 
+    _channel = None
+    _callback_queue = None
+    _futures: dict[str, asyncio.Future] = {}
+    _lock = asyncio.Lock()
+
+    @staticmethod
+    async def _get_callback_queue():
+        """Return the shared reply queue, declaring it on first use"""
+        if RPCService._callback_queue:
+            return RPCService._callback_queue
+
+        async with RPCService._lock:
+            if RPCService._callback_queue:
+                return RPCService._callback_queue
+
+            connection = await Broker.connect()
+            channel = await connection.channel()
+            queue = await channel.declare_queue("", exclusive=True, auto_delete=True)
+            await queue.consume(RPCService._on_response, no_ack=True)
+
+            RPCService._channel = channel
+            RPCService._callback_queue = queue
+            return queue
+
+    @staticmethod
+    async def _on_response(message: aio_pika.IncomingMessage):
+        """Resolve the in-flight request matching the response correlation ID"""
+        future = RPCService._futures.pop(message.correlation_id, None)
+        if future and not future.done():
+            future.set_result(json.loads(message.body))
+
     @staticmethod
     async def request(
         service_rpc: str,
@@ -71,23 +102,13 @@ class RPCService:
         >>> RPCService.request("service", {"key": "value"})
         """
         correlation_id = str(uuid.uuid4())
+        future = asyncio.get_running_loop().create_future()
+        RPCService._futures[correlation_id] = future
 
         try:
-            connection = await Broker.connect()
-            channel = await connection.channel()
-            queue = await channel.declare_queue("", exclusive=True, auto_delete=True)
-
-            future = asyncio.get_event_loop().create_future()
-
-            async def on_response(message: aio_pika.IncomingMessage):
-                if message.correlation_id == correlation_id:
-                    if not future.done():
-                        future.set_result(json.loads(message.body))
-                        await message.ack()
-
-            consumer_tag = await queue.consume(on_response)
+            queue = await RPCService._get_callback_queue()
 
-            await channel.default_exchange.publish(
+            await RPCService._channel.default_exchange.publish(
                 aio_pika.Message(
                     body=json.dumps(request_payload).encode(),
                     correlation_id=correlation_id,
@@ -104,15 +125,26 @@ class RPCService:
         except Exception as err:
             logging.error(f"Failed to request data: {err}")
         finally:
-            try:
-                await queue.cancel(consumer_tag)
-                await queue.delete()
-                await channel.close()
-            except Exception as delete_err:
-                logging.error(f"Failed to delete queue: {delete_err}")
+            RPCService._futures.pop(correlation_id, None)
 
     @staticmethod
-    async def respond(responder):
+    async def close():
+        """Close the shared reply channel"""
+        for future in RPCService._futures.values():
+            future.cancel()
+        RPCService._futures.clear()
+
+        try:
+            if RPCService._channel:
+                await RPCService._channel.close()
+        except Exception as close_err:
+            logging.error(f"Failed to close channel: {close_err}")
+        finally:
+            RPCService._channel = None
+            RPCService._callback_queue = None
+
+    @staticmethod
+    async def respond(responder, concurrency: int = RPC_CONCURRENCY):
         """
         Respond to RPC requests
 
@@ -120,6 +152,8 @@ class RPCService:
         ----------
         responder : object
             The service responder with a respond_rpc method
+        concurrency : int, optional
+            The number of requests handled at once, by default RPC_CONCURRENCY
 
         Returns
         -------
@@ -134,28 +168,49 @@ class RPCService:
         ...
         >>> RPCService.respond(Responder)
         """
+        channel = None
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = set()
+
+        async def handle(message: aio_pika.IncomingMessage):
+            try:
+                async with message.process():
+                    request_payload = json.loads(message.body)
+                    response = await responder.respond_rpc(request_payload)
+                    await channel.default_exchange.publish(
+                        aio_pika.Message(
+                            body=json.dumps(response).encode(),
+                            correlation_id=message.correlation_id,
+                        ),
+                        routing_key=message.reply_to,
+                    )
+            except Exception as err:
+                logging.error(f"Failed to respond to request: {err}")
+            finally:
+                semaphore.release()
+
         try:
             connection = await Broker.connect()
             channel = await connection.channel()
+            await channel.set_qos(prefetch_count=concurrency)
             queue = await channel.declare_queue(RPC_QUEUE, auto_delete=True)
             logging.info(f"Responding to RPC requests: {RPC_QUEUE}")
 
             async with queue.iterator() as queue_iter:
                 async for message in queue_iter:
-                    async with message.process():
-                        request_payload = json.loads(message.body)
-                        response = await responder.respond_rpc(request_payload)
-                        await channel.default_exchange.publish(
-                            aio_pika.Message(
-                                body=json.dumps(response).encode(),
-                                correlation_id=message.correlation_id,
-                            ),
-                            routing_key=message.reply_to,
-                        )
+                    await semaphore.acquire()
+                    task = asyncio.create_task(handle(message))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+        except asyncio.CancelledError:
+            logging.info(f"Draining {len(tasks)} RPC requests")
         except Exception as err:
             logging.error(f"Failed to respond to request: {err}")
         finally:
             try:
-                await channel.close()
+                if tasks:
+                    await asyncio.wait(tasks, timeout=RPC_DRAIN_TIMEOUT)
+                if channel:
+                    await channel.close()
             except Exception as close_err:
                 logging.error(f"Failed to close channel: {close_err}")
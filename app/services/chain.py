@@ -1,25 +1,24 @@
 from langchain_core.messages import MessageLikeRepresentation, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_groq import ChatGroq
-from langchain_ollama import ChatOllama
 
-from app import GROQ_API_KEY, GROQ_MODEL, MODEL, USE_GROQ
 from app.services.system_messages import interview_guidelines
+from app.utils.llm import LLMClient
 
-_llm = (
-    ChatGroq(model=GROQ_MODEL, api_key=GROQ_API_KEY)
-    if USE_GROQ
-    else ChatOllama(model=MODEL)
-)
+_guidelines_message = SystemMessage(content=interview_guidelines.strip())
+"""Interview guidelines, the start of the prompt of every interview."""
 
 
 class ChainService:
-    """Service for handling chain operations."""
+    """Service for handling chain operations.
+
+    The prompt starts with a static prefix, ordered from the most to the least
+    shared: the guidelines, the job description, then the resume. It is
+    byte-identical across the turns of an interview, so the model can reuse
+    its prompt cache, and only the history and the new input follow it.
+    """
 
     def __init__(self, job_description: str, resume: str):
-        self.messages: list[MessageLikeRepresentation] = [
-            SystemMessage(content=interview_guidelines)
-        ]
+        self.messages: list[MessageLikeRepresentation] = [_guidelines_message]
 
         self.add_job_description(job_description)
         self.add_resume(resume)
@@ -34,12 +33,12 @@ class ChainService:
 
     def add_job_description(self, job_description: str):
         """Add the job description to the chain."""
-        content = f"Job Description: {job_description}"
+        content = f"Job Description: {job_description.strip()}"
         self.add_message(SystemMessage(content=content))
 
     def add_resume(self, resume: str):
         """Add the resume to the chain."""
-        content = f"Resume: {resume}"
+        content = f"Resume: {resume.strip()}"
         self.add_message(SystemMessage(content=content))
 
     def finalize_prompt(self):
@@ -58,5 +57,5 @@ class ChainService:
         """Get the chain for the conversation."""
         if self.chain:
             return self.chain
-        self.chain = self.get_prompt() | _llm
+        self.chain = self.get_prompt() | LLMClient.get()
         return self.chain
@@ -1,14 +1,56 @@
+import asyncio
+import logging
+from typing import AsyncIterator
+
 from langchain_core.runnables.history import RunnableWithMessageHistory
 from langchain_core.runnables.utils import ConfigurableFieldSpec
+from langchain_redis import RedisChatMessageHistory
 
-from app import FEEDBACK_DELAY, INTERVIEW_DURATION, SCHEDULER_QUEUE, SERVICE_QUEUE
+from app import (
+    FEEDBACK_DELAY,
+    HISTORY_TYPE_WINDOW,
+    HISTORY_WINDOW,
+    INTERVIEW_DURATION,
+    SCHEDULER_QUEUE,
+    SERVICE_QUEUE,
+    SESSION_CACHE_SIZE,
+    SESSION_CACHE_STATS_INTERVAL,
+    SESSION_CACHE_TTL,
+)
 from app.services.broker.events import EventService
 from app.services.chain import ChainService
-from app.services.chat_history import ChatHistoryService
+from app.services.chat_history import ChatHistoryService, SummarizedChatHistory
+from app.services.lifecycle import LifecycleService
 from app.services.redis import RedisService
+from app.services.summary import SummaryService
 from app.types.communications import EventType
 from app.types.message_response import MessageResponse
+from app.utils.cache import TTLCache
 from app.utils.errors import BadRequestException400, NotFoundException404
+from app.utils.sentences import split_sentences
+
+
+class ChatSession:
+    """Per-interview chat state reused across conversation turns."""
+
+    def __init__(
+        self,
+        user_id: str,
+        job_description: str,
+        resume: str,
+        history: RedisChatMessageHistory,
+        history_window: int,
+        runnable: RunnableWithMessageHistory,
+    ):
+        self.user_id = user_id
+        self.job_description = job_description
+        self.resume = resume
+        self.history = history
+        self.history_window = history_window
+        self.runnable = runnable
+
+
+_sessions: TTLCache[ChatSession] = TTLCache(SESSION_CACHE_SIZE, SESSION_CACHE_TTL)
 
 
 class ChatService:
@@ -24,24 +66,125 @@ class ChatService:
         user_id: str,
     ):
         self.interview_id = interview_id
+        self.user_id = user_id
+
+        self.job_description = None
+        self.resume = None
+
+        self.history = None
+        self.history_window = 0
+        self.runnable = None
+
+    @staticmethod
+    def invalidate(interview_id: str) -> None:
+        """Drop the cached chat session of the interview."""
+        _sessions.pop(interview_id)
+
+    @staticmethod
+    def cache_stats() -> dict:
+        """Get the chat session cache size and hit/miss counters."""
+        return _sessions.stats()
 
-        if user_id != RedisService.get_user(self.interview_id):
+    @staticmethod
+    async def log_cache_stats() -> None:
+        """Log the chat session cache counters every SESSION_CACHE_STATS_INTERVAL."""
+        while True:
+            await asyncio.sleep(SESSION_CACHE_STATS_INTERVAL)
+
+            stats = ChatService.cache_stats()
+            lookups = stats["hits"] + stats["misses"]
+            hit_rate = stats["hits"] / lookups if lookups else 0.0
+            logging.info(
+                f"Chat session cache: {stats['size']} sessions, {stats['hits']} "
+                f"hits, {stats['misses']} misses, {hit_rate:.0%} hit rate"
+            )
+
+    async def initialize(self) -> None:
+        """Load the chat session, reusing the cached one if available."""
+        session = _sessions.get(self.interview_id)
+
+        if session is None:
+            session = await self._load_session()
+            _sessions.set(self.interview_id, session)
+
+        if self.user_id != session.user_id:
             raise BadRequestException400("User not authorized.")
 
-        self.job_description = RedisService.get_job_description(self.interview_id)
-        self.resume = RedisService.get_resume(self.interview_id)
+        self._use_session(session)
+
+    async def create_session(
+        self,
+        job_description: str,
+        resume: str,
+        interview_type: RedisService.InterviewType,
+    ) -> None:
+        """Create the chat session from details already fetched, not from Redis."""
+        history = await ChatHistoryService.aget_history(self.interview_id)
+        session = self._build_session(
+            self.user_id, job_description, resume, interview_type, history
+        )
+        _sessions.set(self.interview_id, session)
+        self._use_session(session)
+
+    def _use_session(self, session: ChatSession) -> None:
+        """Use the chat state of the session."""
+        self.job_description = session.job_description
+        self.resume = session.resume
+        self.history = session.history
+        self.history_window = session.history_window
+        self.runnable = session.runnable
+
+    async def _load_session(self) -> ChatSession:
+        """Load the interview details and build the chat session."""
+        details, history = await asyncio.gather(
+            RedisService.get_details(
+                self.interview_id,
+                RedisService.Namespace.USER,
+                RedisService.Namespace.JOB_DESCRIPTION,
+                RedisService.Namespace.RESUME,
+                RedisService.Namespace.INTERVIEW_TYPE,
+            ),
+            ChatHistoryService.aget_history(self.interview_id),
+        )
+        user_id = details[RedisService.Namespace.USER]
+        job_description = details[RedisService.Namespace.JOB_DESCRIPTION]
+        resume = details[RedisService.Namespace.RESUME]
+        interview_type = (
+            details[RedisService.Namespace.INTERVIEW_TYPE]
+            or RedisService.InterviewType.NORMAL
+        )
+
+        if self.user_id != user_id:
+            raise BadRequestException400("User not authorized.")
 
-        if not self.job_description or not self.resume:
+        if not job_description or not resume:
             raise NotFoundException404("Interview not found.")
 
-        self.chain = ChainService(
-            job_description=self.job_description,
-            resume=self.resume,
+        return self._build_session(
+            user_id, job_description, resume, interview_type, history
+        )
+
+    def _build_session(
+        self,
+        user_id: str,
+        job_description: str,
+        resume: str,
+        interview_type: RedisService.InterviewType,
+        history: RedisChatMessageHistory,
+    ) -> ChatSession:
+        """Build the chat runnable of the interview."""
+        chain = ChainService(
+            job_description=job_description,
+            resume=resume,
         ).get_chain()
 
-        self.runnable = RunnableWithMessageHistory(
-            self.chain,
-            ChatHistoryService.get_history,
+        # The prompt reads older turns as a summary, the full history is kept
+        history_window = HISTORY_TYPE_WINDOW.get(interview_type, HISTORY_WINDOW)
+        prompt_history = SummarizedChatHistory(history) if history_window else history
+
+        runnable = RunnableWithMessageHistory(
+            chain,
+            lambda interview_id: prompt_history,
             input_messages_key=self._INPUT_MESSAGES_KEY,
             history_messages_key=self._HISTORY_MESSAGES_KEY,
             history_factory_config=[
@@ -55,54 +198,85 @@ class ChatService:
             ],
         )
 
-    def set_active(self):
+        return ChatSession(
+            user_id, job_description, resume, history, history_window, runnable
+        )
+
+    async def set_active(self):
         """Set the chat service to active."""
-        RedisService.set_status(self.interview_id, RedisService.Status.ACTIVE)
+        await RedisService.set_status(self.interview_id, RedisService.Status.ACTIVE)
 
-    def set_inactive(self):
+    async def set_inactive(self):
         """Set the chat service to inactive."""
-        RedisService.set_status(self.interview_id, RedisService.Status.INACTIVE)
+        await RedisService.set_status(self.interview_id, RedisService.Status.INACTIVE)
 
-    def is_active(self) -> bool:
+    async def is_active(self) -> bool:
         """Check if the chat service is active."""
-        return RedisService.get_status(self.interview_id) == RedisService.Status.ACTIVE
+        return (
+            await RedisService.get_status(self.interview_id)
+            == RedisService.Status.ACTIVE
+        )
 
-    def invoke(self, message: str) -> MessageResponse:
+    async def invoke(self, message: str) -> MessageResponse:
         """Invoke the chat service with a message."""
-        if not self.is_active():
+        if not await self.is_active():
             raise BadRequestException400("Inactive interview.")
 
-        response = self.runnable.invoke(
+        response = await self.runnable.ainvoke(
             {self._INPUT_MESSAGES_KEY: message},
             config={"configurable": {self._INTERVIEW_ID_KEY: self.interview_id}},
         )
 
         return MessageResponse(message=response.content)
 
+    async def stream(self, message: str, sentences: bool = False) -> AsyncIterator[str]:
+        """Stream the reply to a message, as tokens or as whole sentences."""
+        if not await self.is_active():
+            raise BadRequestException400("Inactive interview.")
+
+        chunks = self._stream_tokens(message)
+        return split_sentences(chunks) if sentences else chunks
+
+    async def _stream_tokens(self, message: str) -> AsyncIterator[str]:
+        """Stream the reply tokens; the history is saved once the stream ends."""
+        async for chunk in self.runnable.astream(
+            {self._INPUT_MESSAGES_KEY: message},
+            config={"configurable": {self._INTERVIEW_ID_KEY: self.interview_id}},
+        ):
+            if chunk.content:
+                yield chunk.content
+
+    async def update_summary(self) -> None:
+        """Fold the turns before the history window into the rolling summary."""
+        if self.history_window:
+            await SummaryService.update_summary(self.interview_id, self.history_window)
+
     async def start(self) -> MessageResponse:
         """Start the chat service."""
-        RedisService.set_job_description(self.interview_id, self.job_description)
-        RedisService.set_resume(self.interview_id, self.resume)
-
-        await EventService.publish(
-            SCHEDULER_QUEUE,
-            EventService.build_request_payload(
-                type=EventType.SCHEDULE_EVENT,
-                data={
-                    "id": f"feedback_{self.interview_id}",
-                    "seconds": (INTERVIEW_DURATION + FEEDBACK_DELAY) * 60,
-                    "service": SERVICE_QUEUE,
-                    "type": EventType.GENERATE_REPORT,
-                    "data": {"interview_id": self.interview_id},
-                },
+        _, response = await asyncio.gather(
+            EventService.publish(
+                SCHEDULER_QUEUE,
+                EventService.build_request_payload(
+                    type=EventType.SCHEDULE_EVENT,
+                    data={
+                        "id": f"feedback_{self.interview_id}",
+                        "seconds": (INTERVIEW_DURATION + FEEDBACK_DELAY) * 60,
+                        "service": SERVICE_QUEUE,
+                        "type": EventType.GENERATE_REPORT,
+                        "data": {"interview_id": self.interview_id},
+                    },
+                ),
             ),
+            self.invoke("Hello"),
         )
 
-        return self.invoke("Hello")
+        return response
 
     async def end(self) -> None:
         """End the chat service."""
-        self.set_inactive()
+        await self.set_inactive()
+        ChatService.invalidate(self.interview_id)
+        await LifecycleService.set_ended(self.interview_id)
 
         await EventService.publish(
             SCHEDULER_QUEUE,
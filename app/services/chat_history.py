@@ -1,8 +1,69 @@
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+import asyncio
+import json
+from typing import Sequence
+
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    messages_from_dict,
+)
 from langchain_redis import RedisChatMessageHistory
+from redisvl.query import FilterQuery
+from redisvl.query.filter import Tag
 
+from app import INTERVIEW_TTL
 from app.services.redis import RedisService
 
+_MAX_MESSAGES = 10000
+"""Most messages read at once, the same bound the LangChain history uses."""
+
+
+class SummarizedChatHistory(BaseChatMessageHistory):
+    """Chat history read as a rolling summary and the messages after it.
+
+    Messages are still written to the full history, which is kept for the
+    interview details and feedback.
+    """
+
+    def __init__(self, history: RedisChatMessageHistory):
+        self.history = history
+
+    @property
+    def messages(self) -> list[BaseMessage]:
+        """Get the full history, the summary is only read asynchronously."""
+        return self.history.messages
+
+    async def aget_messages(self) -> list[BaseMessage]:
+        """Get the summary of the older messages and the messages after it."""
+        summary = await RedisService.get_summary(self.history.session_id)
+        if not summary:
+            return await self.history.aget_messages()
+
+        messages = await asyncio.to_thread(
+            ChatHistoryService.query_messages, self.history, summary["count"]
+        )
+        return [
+            SystemMessage(
+                content=f"Summary of the earlier conversation: {summary['summary']}"
+            ),
+            *messages,
+        ]
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """Add messages to the full history."""
+        self.history.add_messages(messages)
+
+    async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """Add messages to the full history."""
+        await self.history.aadd_messages(messages)
+
+    def clear(self) -> None:
+        """Clear the full history."""
+        self.history.clear()
+
 
 class ChatHistoryService:
     """Service to interact with chat history."""
@@ -12,38 +73,113 @@ class ChatHistoryService:
         """Get the chat history for the interview."""
         return RedisChatMessageHistory(
             interview_id,
-            redis_client=RedisService.get_client(),
+            redis_client=RedisService.get_sync_client(),
+            ttl=INTERVIEW_TTL,
+        )
+
+    @staticmethod
+    async def aget_history(interview_id: str) -> RedisChatMessageHistory:
+        """Get the chat history for the interview without blocking the event loop."""
+        return await asyncio.to_thread(ChatHistoryService.get_history, interview_id)
+
+    @staticmethod
+    def query_messages(
+        history: RedisChatMessageHistory, offset: int = 0, count: int = _MAX_MESSAGES
+    ) -> list[BaseMessage]:
+        """Get count messages of the chat history from offset, oldest first."""
+        query = (
+            FilterQuery(
+                filter_expression=Tag("session_id") == history.session_id,
+                return_fields=["type", "$.data"],
+                num_results=count,
+            )
+            .sort_by("timestamp", asc=True)
+            .paging(offset, count)
+        )
+
+        return messages_from_dict(
+            [
+                {"type": message["type"], "data": json.loads(message["$.data"])}
+                for message in history.index.query(query)
+            ]
+        )
+
+    @staticmethod
+    async def get_conversation_page(
+        interview_id: str, offset: int = 0, count: int = _MAX_MESSAGES
+    ) -> list[tuple[str, str]]:
+        """Get the type and content of count human and AI messages from offset.
+
+        Only these two fields are read, the messages are not deserialised.
+        """
+        history = await ChatHistoryService.aget_history(interview_id)
+        count = min(count, _MAX_MESSAGES - offset)
+        if count <= 0:
+            return []
+
+        query = (
+            FilterQuery(
+                filter_expression=(Tag("session_id") == history.session_id)
+                & (Tag("type") == ["human", "ai"]),
+                return_fields=["type", "content"],
+                num_results=count,
+            )
+            .sort_by("timestamp", asc=True)
+            .paging(offset, count)
+        )
+
+        results = await asyncio.to_thread(history.index.query, query)
+        return [(result["type"], result["content"]) for result in results]
+
+    @staticmethod
+    async def has_messages(interview_id: str) -> bool:
+        """Check if the chat history has any message."""
+        history = await ChatHistoryService.aget_history(interview_id)
+        return await asyncio.to_thread(len, history) > 0
+
+    @staticmethod
+    async def get_message_keys(interview_id: str) -> list[str]:
+        """Get the keys of the messages in the chat history."""
+        history = await ChatHistoryService.aget_history(interview_id)
+        query = FilterQuery(
+            filter_expression=Tag("session_id") == history.session_id,
+            return_fields=["id"],
+            num_results=_MAX_MESSAGES,
         )
+        results = await asyncio.to_thread(history.index.query, query)
+        return [result["id"] for result in results]
 
     @staticmethod
-    def add_message(interview_id: str, message: BaseMessage):
+    async def add_message(interview_id: str, message: BaseMessage):
         """Add a message to the chat history."""
-        ChatHistoryService.get_history(interview_id).add_message(message)
+        history = await ChatHistoryService.aget_history(interview_id)
+        await history.aadd_messages([message])
 
     @staticmethod
-    def add_human_message(interview_id: str, message: str):
+    async def add_human_message(interview_id: str, message: str):
         """Add a human message to the chat history."""
-        ChatHistoryService.get_history(interview_id).add_message(
-            HumanMessage(content=message)
+        await ChatHistoryService.add_message(
+            interview_id, HumanMessage(content=message)
         )
 
     @staticmethod
-    def add_system_message(interview_id: str, message: str):
+    async def add_system_message(interview_id: str, message: str):
         """Add a system message to the chat history."""
-        ChatHistoryService.get_history(interview_id).add_message(
-            SystemMessage(content=message)
+        await ChatHistoryService.add_message(
+            interview_id, SystemMessage(content=message)
         )
 
     @staticmethod
-    def get_messages(interview_id: str):
+    async def get_messages(interview_id: str):
         """Get messages in the chat history."""
         return [
             message
-            for message in ChatHistoryService.get_history(interview_id).messages
+            for message in await ChatHistoryService.get_all_messages(interview_id)
             if isinstance(message, HumanMessage) or isinstance(message, AIMessage)
         ]
 
     @staticmethod
-    def get_all_messages(interview_id: str):
+    async def get_all_messages(interview_id: str):
         """Get all messages in the chat history."""
-        return ChatHistoryService.get_history(interview_id).messages
+        history = await ChatHistoryService.aget_history(interview_id)
+        return await history.aget_messages()
@@ -1,7 +1,8 @@
 import logging
 
-from app.services.feedback import FeedbackService
 from app.services.interview import InterviewService
+from app.services.lifecycle import LifecycleService
+from app.services.report import ReportService
 from app.types.communications import EventType
 
 
@@ -17,9 +18,10 @@ class EventsService:
             if not event.get("data") or not event["data"].get("interview_id"):
                 return
             interview_id = event["data"]["interview_id"]
-            feedback = FeedbackService(interview_id).get_feedback()
+            feedback = await ReportService.generate(interview_id)
 
             await InterviewService(interview_id).publish_feedback(feedback.dict())
+            await LifecycleService.set_published(interview_id)
 
     @staticmethod
     async def respond_rpc(message):
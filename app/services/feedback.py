@@ -1,13 +1,20 @@
+import asyncio
+import logging
 import time
-from typing import List
+from typing import Awaitable, Callable, List, Union
 
+from langchain_core.messages import BaseMessage
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import PromptTemplate
-from langchain_groq import ChatGroq
-from langchain_ollama import ChatOllama
 from pydantic import BaseModel, Field
 
-from app import GROQ_API_KEY, GROQ_MODEL, MODEL, USE_GROQ
+from app import (
+    FEEDBACK_ATTEMPT_TIMEOUT,
+    FEEDBACK_CONCURRENCY,
+    FEEDBACK_MAX_ATTEMPTS,
+    FEEDBACK_RETRY_BUDGET,
+)
+from app.services.archive import ArchiveService
 from app.services.chat_history import ChatHistoryService
 from app.services.redis import RedisService
 from app.services.system_messages import (
@@ -19,6 +26,8 @@ from app.types.interview_report_response import (
     InterviewReportResponse,
 )
 from app.utils.errors.exceptions import BadRequestException400, NotFoundException404
+from app.utils.llm import LLMClient
+from app.utils.retry import RetryPolicy
 from app.utils.timer import is_interview_ended
 
 
@@ -54,94 +63,170 @@ _overall_prompt = PromptTemplate(
     },
 )
 
-
-_llm = (
-    ChatGroq(model=GROQ_MODEL, api_key=GROQ_API_KEY)
-    if USE_GROQ
-    else ChatOllama(model=MODEL)
+_retry_policy = RetryPolicy(
+    max_attempts=FEEDBACK_MAX_ATTEMPTS,
+    attempt_timeout=FEEDBACK_ATTEMPT_TIMEOUT,
+    budget=FEEDBACK_RETRY_BUDGET,
 )
 
+_DEGRADED_FEEDBACK = "Feedback could not be generated for this response."
+_DEGRADED_OVERALL_FEEDBACK = "Overall feedback could not be generated."
+
+_scoring: set[str] = set()
+"""Interviews whose answers are being scored in the background."""
+
 
 class FeedbackService:
     """Service for handling feedback operations."""
 
     def __init__(self, interview_id: str):
-        start_time = RedisService.get_time(interview_id)
-        if start_time is None:
-            raise NotFoundException404("Interview not found.")
+        self.interview_id = interview_id
+
+        self.job_description = None
+        self.resume = None
+
+        self.retries = 0
+        """Number of LLM retries made while generating the report."""
 
-        start_time = float(start_time)
-        elapsed_time = time.time() - start_time
+        self.archived_feedback = None
+        """Report of an interview evicted from Redis, read from the archive."""
 
-        if not is_interview_ended(elapsed_time, interview_id):
+        self.on_progress: Union[Callable[[int, int], Awaitable[None]], None] = None
+        """Called with the answers scored and the total while generating."""
+
+    async def initialize(self) -> None:
+        """Load the interview details, ensuring the interview has ended."""
+        details = await RedisService.get_details(
+            self.interview_id,
+            RedisService.Namespace.TIME,
+            RedisService.Namespace.STATUS,
+            RedisService.Namespace.JOB_DESCRIPTION,
+            RedisService.Namespace.RESUME,
+        )
+
+        start_time = details[RedisService.Namespace.TIME]
+        if start_time is None:
+            # Evicted from Redis once the report was published
+            self.archived_feedback = await ArchiveService.get_feedback(
+                self.interview_id
+            )
+            if self.archived_feedback is None:
+                raise NotFoundException404("Interview not found.")
+            return
+
+        elapsed_time = time.time() - float(start_time)
+        if not is_interview_ended(elapsed_time, details[RedisService.Namespace.STATUS]):
             raise BadRequestException400("Interview has not ended yet.")
 
-        self.interview_id = interview_id
+        self.job_description = details[RedisService.Namespace.JOB_DESCRIPTION]
+        self.resume = details[RedisService.Namespace.RESUME]
+
+    async def load_details(self) -> None:
+        """Load the job description and resume of the interview."""
+        details = await RedisService.get_details(
+            self.interview_id,
+            RedisService.Namespace.JOB_DESCRIPTION,
+            RedisService.Namespace.RESUME,
+        )
+        self.job_description = details[RedisService.Namespace.JOB_DESCRIPTION]
+        self.resume = details[RedisService.Namespace.RESUME]
+
+    @staticmethod
+    def _get_pairs(messages: List[BaseMessage]) -> List[tuple[int, str, str]]:
+        """Get the indexed question/answer pairs, skipping the start message."""
+        messages = messages[1:]
+        pairs = []
+
+        for i in range(len(messages) // 2):
+            index = i * 2
+            question = messages[index].content
+            answer = messages[index + 1].content
+
+            if not question or not answer:
+                continue
+
+            pairs.append((i, question, answer))
+
+        return pairs
+
+    @staticmethod
+    def _get_stored_feedback(
+        answer_feedbacks: dict[int, dict], index: int, question: str, answer: str
+    ) -> Union[IndividualInterviewReportResponse, None]:
+        """Get the stored feedback of a pair, if it was scored for the same text."""
+        stored = answer_feedbacks.get(index)
+
+        if not stored or stored["question"] != question or stored["answer"] != answer:
+            return None
 
-        self.job_description = RedisService.get_job_description(self.interview_id)
-        self.resume = RedisService.get_resume(self.interview_id)
+        return IndividualInterviewReportResponse.from_dict(stored)
 
-    def _generate_feedback(
+    async def _generate_feedback(
         self, question: str, answer: str
-    ) -> IndividualInterviewReportResponse:
+    ) -> Union[IndividualInterviewReportResponse, None]:
         """Generate feedback based on the job description and resume."""
-        chain = _individual_prompt | _llm | _feedback_request_parser
+        chain = _individual_prompt | LLMClient.get() | _feedback_request_parser
 
-        feedback = ""
-        score = 0.0
-
-        while not feedback or score == 0.0:
-            response = chain.invoke(
+        response, retries = await _retry_policy.run(
+            lambda: chain.ainvoke(
                 {
                     "job_description": self.job_description,
                     "resume": self.resume,
                     "question": question,
                     "answer": answer,
                 }
-            )
+            ),
+            is_valid=lambda response: isinstance(response, dict)
+            and bool(response.get("feedback"))
+            and isinstance(response.get("score"), (int, float)),
+            name=f"feedback for interview {self.interview_id}",
+        )
+        self.retries += retries
 
-            feedback = response.get("feedback", "")
-            score = response.get("score", 0.0)
+        if response is None:
+            return None
 
         return IndividualInterviewReportResponse(
             question=question,
             answer=answer,
-            feedback=feedback,
-            score=score,
+            feedback=response["feedback"],
+            score=response["score"],
         )
 
-    def _get_overall_feedback(
+    async def _get_overall_feedback(
         self, feedbacks: List[IndividualInterviewReportResponse]
     ) -> str:
         """Generate overall feedback based on the job description and resume."""
-        chain = _overall_prompt | _llm | _overall_feedback_request_parser
+        chain = _overall_prompt | LLMClient.get() | _overall_feedback_request_parser
 
-        feedback = ""
-
-        while not feedback:
-            response = chain.invoke(
+        response, retries = await _retry_policy.run(
+            lambda: chain.ainvoke(
                 {
                     "job_description": self.job_description,
                     "resume": self.resume,
                     "feedbacks": [feedback.feedback for feedback in feedbacks],
                 }
-            )
+            ),
+            is_valid=lambda response: isinstance(response, dict)
+            and bool(response.get("feedback")),
+            name=f"overall feedback for interview {self.interview_id}",
+        )
+        self.retries += retries
 
-            feedback = response.get("feedback", "")
+        if response is None:
+            return _DEGRADED_OVERALL_FEEDBACK
 
-        return feedback
+        return response["feedback"]
 
-    def _get_feedback(self) -> InterviewReportResponse:
+    async def _get_feedback(self) -> InterviewReportResponse:
         """Generate feedback for all questions and answers."""
-        messages = ChatHistoryService.get_messages(self.interview_id)
+        messages = await ChatHistoryService.get_messages(self.interview_id)
 
         if not messages or len(messages) == 0:
             raise NotFoundException404("Interview not found.")
 
-        messages = messages[1:]
-
         # If number of messages < 2, then there are no questions and answers
-        if len(messages) < 2:
+        if len(messages[1:]) < 2:
             return InterviewReportResponse(
                 interview_id=self.interview_id,
                 feedbacks=[],
@@ -149,22 +234,79 @@ class FeedbackService:
                 final_score=0.0,
             )
 
-        feedbacks = []
+        pairs = self._get_pairs(messages)
+        answer_feedbacks = await RedisService.get_answer_feedbacks(self.interview_id)
 
-        for i in range(len(messages) // 2):
-            index = i * 2
-            question = messages[index].content
-            answer = messages[index + 1].content
+        semaphore = asyncio.Semaphore(FEEDBACK_CONCURRENCY)
+        scored_count = 0
 
-            if not question or not answer:
-                continue
+        async def report_progress():
+            nonlocal scored_count
+            scored_count += 1
+            if self.on_progress:
+                await self.on_progress(scored_count, len(pairs))
 
-            feedback = self._generate_feedback(question, answer)
-            feedbacks.append(feedback)
+        async def generate(position: int, index: int, question: str, answer: str):
+            # Answers scored during the interview, or by an interrupted run of
+            # the report, are reused as they are
+            stored = self._get_stored_feedback(
+                answer_feedbacks, index, question, answer
+            )
+            if stored:
+                await report_progress()
+                return stored
+
+            async with semaphore:
+                start_time = time.perf_counter()
+                feedback = await self._generate_feedback(question, answer)
+                logging.info(
+                    f"Generated feedback {position + 1}/{len(pairs)} for interview "
+                    f"{self.interview_id} in {time.perf_counter() - start_time:.2f}s"
+                )
+
+            if feedback:
+                await RedisService.set_answer_feedback(
+                    self.interview_id, index, feedback.dict()
+                )
+            await report_progress()
+            return feedback
+
+        # gather keeps the feedbacks in transcript order
+        results = await asyncio.gather(
+            *[
+                generate(position, index, question, answer)
+                for position, (index, question, answer) in enumerate(pairs)
+            ]
+        )
 
-        final_score = sum([feedback.score for feedback in feedbacks]) / len(feedbacks)
+        # Pairs the model failed to score are reported but left out of the score
+        scored = [feedback for feedback in results if feedback is not None]
+        feedbacks = [
+            (
+                feedback
+                if feedback is not None
+                else IndividualInterviewReportResponse(
+                    question=question,
+                    answer=answer,
+                    feedback=_DEGRADED_FEEDBACK,
+                    score=0.0,
+                )
+            )
+            for feedback, (_, question, answer) in zip(results, pairs)
+        ]
+
+        final_score = (
+            sum([feedback.score for feedback in scored]) / len(scored)
+            if scored
+            else 0.0
+        )
+
+        overall_feedback = await self._get_overall_feedback(scored)
 
-        overall_feedback = self._get_overall_feedback(feedbacks)
+        logging.info(
+            f"Generated report for interview {self.interview_id} with "
+            f"{self.retries} retries and {len(results) - len(scored)} degraded feedbacks"
+        )
 
         return InterviewReportResponse(
             interview_id=self.interview_id,
@@ -173,23 +315,69 @@ class FeedbackService:
             final_score=final_score,
         )
 
-    def generate_feedback(self) -> None:
-        """Generate feedback for the question and answer."""
-        feedback = RedisService.get_feedback(self.interview_id)
-
-        if feedback:
+    async def generate_answer_feedbacks(self) -> None:
+        """Score the answered questions that have no stored feedback yet."""
+        if self.interview_id in _scoring:
             return
 
-        feedback = self._get_feedback()
-        RedisService.set_feedback(self.interview_id, feedback.dict())
+        _scoring.add(self.interview_id)
+
+        try:
+            messages, answer_feedbacks, _ = await asyncio.gather(
+                ChatHistoryService.get_messages(self.interview_id),
+                RedisService.get_answer_feedbacks(self.interview_id),
+                self.load_details(),
+            )
+
+            for index, question, answer in self._get_pairs(messages):
+                if self._get_stored_feedback(answer_feedbacks, index, question, answer):
+                    continue
+
+                feedback = await self._generate_feedback(question, answer)
+                if feedback:
+                    await RedisService.set_answer_feedback(
+                        self.interview_id, index, feedback.dict()
+                    )
+        except Exception as err:
+            logging.error(
+                f"Error scoring answers for interview {self.interview_id}: {err}"
+            )
+        finally:
+            _scoring.discard(self.interview_id)
+
+    @staticmethod
+    async def score_answers(interview_id: str) -> None:
+        """Score the answered questions of a running interview."""
+        await FeedbackService(interview_id).generate_answer_feedbacks()
+
+    async def generate_feedback(
+        self, fencing_token: int
+    ) -> Union[InterviewReportResponse, None]:
+        """Generate and store the feedback, unless it is already stored.
 
-    def get_feedback(self) -> InterviewReportResponse:
-        """Get the feedback for the interview."""
-        feedback = RedisService.get_feedback(self.interview_id)
+        The feedback is stored only while the fencing token holds the report
+        lease, None is returned if the lease was lost while generating.
+        """
+        feedback = await self.get_feedback()
 
         if feedback is not None:
-            return InterviewReportResponse.from_dict(feedback)
+            return feedback
+
+        feedback = await self._get_feedback()
+        if not await RedisService.set_feedback_fenced(
+            self.interview_id, feedback.dict(), fencing_token
+        ):
+            return None
 
-        feedback = self._get_feedback()
-        RedisService.set_feedback(self.interview_id, feedback.dict())
         return feedback
+
+    async def get_feedback(self) -> Union[InterviewReportResponse, None]:
+        """Get the stored feedback for the interview, None if not generated yet."""
+        if self.archived_feedback is not None:
+            return InterviewReportResponse.from_dict(self.archived_feedback)
+
+        feedback = await RedisService.get_feedback(self.interview_id)
+        if feedback is None:
+            return None
+
+        return InterviewReportResponse.from_dict(feedback)
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from typing import Union
 
 from app import (
     INTERVIEW_DURATION,
@@ -10,6 +11,7 @@ from app import (
     SCHEDULER_QUEUE,
     USER_RPC,
 )
+from app.services.archive import ArchiveService
 from app.services.broker.events import EventService
 from app.services.broker.rpc import RPCService
 from app.services.chat_history import ChatHistoryService
@@ -29,9 +31,10 @@ class InterviewService:
 
         self.job_description = None
         self.resume = None
+        self.interview_type = None
 
     async def initialize(self) -> bool:
-        """Initialize the interview details"""
+        """Initialize the interview details and publish the interview start"""
         if not all([self.interview_id, self.user_id]):
             logging.error("Interview ID or User ID not provided.")
             raise BadRequestException400("Interview ID or User ID not provided.")
@@ -54,24 +57,40 @@ class InterviewService:
             )
             raise BadRequestException400("User is not authorized for this interview.")
 
-        if data.get("resume_url"):
-            resume = await fetch_pdf_text(data.get("resume_url"))
-            logging.info(f"Resume: {resume}")
-            if not resume:
-                logging.error(
-                    f"Error fetching resume for interview: {self.interview_id}"
-                )
-                raise NotFoundException404("Error processing the resume.")
-
-            data["resume"] = resume
+        if (
+            await RedisService.get_status(self.interview_id)
+            == RedisService.Status.ACTIVE
+        ):
+            raise BadRequestException400("Interview already started.")
 
         self.job_description = data.get("job_description")
-        self.resume = data.get("resume")
+        self.interview_type = (
+            RedisService.InterviewType.JOB
+            if self.is_job
+            else RedisService.InterviewType.NORMAL
+        )
+
+        self.resume = await self._get_resume(data)
+        await self.set_details()
 
-        self.set_details()
+        # Published only once the interview can run, so no completion is
+        # scheduled for an interview that failed to start
+        await self.publish_interview_started()
 
         return True
 
+    async def _get_resume(self, data: dict) -> str:
+        if not data.get("resume_url"):
+            return data.get("resume")
+
+        resume = await fetch_pdf_text(data.get("resume_url"))
+        logging.info(f"Resume: {resume}")
+        if not resume:
+            logging.error(f"Error fetching resume for interview: {self.interview_id}")
+            raise NotFoundException404("Error processing the resume.")
+
+        return resume
+
     async def _get_data_for_normal_interview(self):
         logging.info(f"Fetching data for normal interview: {self.interview_id}")
         interview_details, resume_url = await asyncio.gather(
@@ -140,41 +159,79 @@ class InterviewService:
             "resume": "Gopal Saraf\nFrontend Developer",
         }
 
-    def set_details(self):
+    async def set_details(self):
         """Set the interview details in redis"""
-        RedisService.set_user(self.interview_id, self.user_id)
-        RedisService.set_job_description(self.interview_id, self.job_description)
-        RedisService.set_resume(self.interview_id, self.resume)
-        RedisService.set_interview_type(
+        await RedisService.set_details(
             self.interview_id,
-            (
-                RedisService.InterviewType.JOB
-                if self.is_job
-                else RedisService.InterviewType.NORMAL
-            ),
+            self.user_id,
+            self.job_description,
+            self.resume,
+            self.interview_type,
         )
 
-    def clear_details(self):
-        """Clear the interview details from redis"""
-        pass
+    async def get_interview_type(self) -> RedisService.InterviewType:
+        """Get the interview type, read from redis unless initialized"""
+        return self.interview_type or await RedisService.get_interview_type(
+            self.interview_id
+        )
 
-    def get_conversation(self):
+    async def clear_details(self) -> int:
+        """Clear the interview details from redis, returning the bytes reclaimed"""
+        message_keys = await ChatHistoryService.get_message_keys(self.interview_id)
+        return await RedisService.delete_keys(
+            [*RedisService.get_interview_keys(self.interview_id), *message_keys]
+        )
+
+    async def get_conversation(self):
         """Get the conversation transcript"""
-        messages = ChatHistoryService.get_messages(self.interview_id)
+        messages = await ChatHistoryService.get_messages(self.interview_id)
+        if not messages:
+            # Evicted from redis once the report was published
+            messages = await ArchiveService.get_messages(self.interview_id)
 
         if not messages or len(messages) == 0:
             return None
 
         return messages[1:]  # Remove start message
 
+    async def get_conversation_page(
+        self, start: int = 0, limit: Union[int, None] = None
+    ) -> Union[tuple[list[tuple[str, str]], bool], None]:
+        """Get a page of the transcript as type and content pairs, and whether more
+        follow"""
+        # The start message is not part of the transcript, and one more message
+        # is read to tell whether more follow
+        offset = start + 1
+        if limit is None:
+            page = await ChatHistoryService.get_conversation_page(
+                self.interview_id, offset
+            )
+        else:
+            page = await ChatHistoryService.get_conversation_page(
+                self.interview_id, offset, limit + 1
+            )
+
+        if not page and not await ChatHistoryService.has_messages(self.interview_id):
+            # Evicted from redis once the report was published
+            messages = await ArchiveService.get_messages(self.interview_id)
+            if not messages:
+                return None
+
+            page = [(message.type, message.content) for message in messages[offset:]]
+
+        if limit is None:
+            return page, False
+
+        return page[:limit], len(page) > limit
+
     async def publish_feedback(self, feedback):
         """Publish the feedback to the broker"""
-        messages = self.get_conversation()
+        messages = await self.get_conversation()
         messages = [
             {"type": message.type, "message": message.content} for message in messages
         ]
 
-        interview_type = RedisService.get_interview_type(self.interview_id)
+        interview_type = await self.get_interview_type()
 
         await EventService.publish(
             (
@@ -195,7 +252,7 @@ class InterviewService:
 
     async def publish_interview_started(self):
         """Publish the interview start event to the broker"""
-        interview_type = RedisService.get_interview_type(self.interview_id)
+        interview_type = await self.get_interview_type()
 
         await asyncio.gather(
             EventService.publish(
@@ -230,7 +287,7 @@ class InterviewService:
 
     async def publish_interview_completed(self):
         """Publish the interview completion event to the broker"""
-        interview_type = RedisService.get_interview_type(self.interview_id)
+        interview_type = await self.get_interview_type()
 
         await EventService.publish(
             SCHEDULER_QUEUE,
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import time
+
+from app import (
+    INTERVIEW_ENDED_TTL,
+    INTERVIEW_PUBLISHED_TTL,
+    REAPER_BATCH,
+    REAPER_GRACE,
+    REAPER_INTERVAL,
+)
+from app.services.archive import ArchiveService
+from app.services.chat_history import ChatHistoryService
+from app.services.interview import InterviewService
+from app.services.redis import RedisService
+
+
+class LifecycleService:
+    """Service for the lifetime of interview state in Redis.
+
+    Active interviews keep their state for INTERVIEW_TTL after the last turn.
+    Once ended they keep it long enough for the report to be generated, and
+    once the report is published the reaper archives and evicts them after
+    REAPER_GRACE. Without an archive, published interviews keep the ended TTL.
+    """
+
+    @staticmethod
+    async def _expire(interview_id: str, ttl: int) -> None:
+        """Set the TTL of the interview state and its chat history."""
+        message_keys = await ChatHistoryService.get_message_keys(interview_id)
+        await RedisService.expire_keys(
+            [*RedisService.get_interview_keys(interview_id), *message_keys], ttl
+        )
+
+    @staticmethod
+    async def set_ended(interview_id: str) -> None:
+        """Keep the state of an ended interview until its report is published."""
+        await LifecycleService._expire(interview_id, INTERVIEW_ENDED_TTL)
+
+    @staticmethod
+    async def set_published(interview_id: str) -> None:
+        """Schedule the state of an interview with a published report for eviction."""
+        # Without an archive, Redis is the only copy, kept as long as ended ones
+        if ArchiveService.get_backend() is None:
+            await LifecycleService._expire(interview_id, INTERVIEW_ENDED_TTL)
+            return
+
+        await LifecycleService._expire(interview_id, INTERVIEW_PUBLISHED_TTL)
+        await RedisService.add_reapable(interview_id, time.time())
+
+    @staticmethod
+    async def reap() -> int:
+        """Archive, then evict, the interviews published before the grace period."""
+        # Without an archive, evicting would lose the transcripts and reports
+        if ArchiveService.get_backend() is None:
+            return 0
+
+        interview_ids = await RedisService.get_reapable(
+            time.time() - REAPER_GRACE, REAPER_BATCH
+        )
+
+        claimed = [
+            interview_id
+            for interview_id in interview_ids
+            if await RedisService.claim_reapable(interview_id)
+        ]
+        if not claimed:
+            return 0
+
+        try:
+            await ArchiveService.archive(claimed)
+        except Exception as err:
+            # Kept in Redis, and retried once the grace period passes again
+            logging.error(f"Error archiving interviews {claimed}: {err}")
+            for interview_id in claimed:
+                await RedisService.add_reapable(interview_id, time.time())
+            return 0
+
+        reaped, reclaimed = 0, 0
+        for interview_id in claimed:
+            try:
+                reclaimed += await InterviewService(interview_id).clear_details()
+                reaped += 1
+            except Exception as err:
+                # The published TTL still evicts the interview
+                logging.error(f"Error reaping interview {interview_id}: {err}")
+
+        if reaped:
+            logging.info(f"Reaped {reaped} interviews, reclaimed {reclaimed} bytes")
+
+        return reclaimed
+
+    @staticmethod
+    async def run_reaper() -> None:
+        """Evict published interviews every REAPER_INTERVAL seconds."""
+        while True:
+            try:
+                await LifecycleService.reap()
+            except Exception as err:
+                logging.error(f"Error running the reaper: {err}")
+
+            await asyncio.sleep(REAPER_INTERVAL)
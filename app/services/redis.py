@@ -1,18 +1,163 @@
+import json
+from contextlib import asynccontextmanager
 from enum import StrEnum
-from typing import Union
+from typing import AsyncIterator, Union
 
-from redis import Redis
-from redis.commands.json.path import Path
+from redis import BlockingConnectionPool as SyncBlockingConnectionPool
+from redis import Redis as SyncRedis
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import PubSub
 from redis.typing import ResponseT
 
-from app import REDIS_URL
+from app import (
+    INTERVIEW_ENDED_TTL,
+    INTERVIEW_TTL,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT,
+    REDIS_URL,
+)
+
+# Fields of the interview record, named after the namespaces of the keys they
+# replace, and the field set once the record holds every one of them
+_RECORD_FIELDS = (
+    "time",
+    "status",
+    "user",
+    "job_description",
+    "resume",
+    "feedback",
+    "interview_type",
+    "warning",
+    "summary",
+)
+_RECORD_VERSION_FIELD = "version"
+
+# KEYS: interview record. ARGV: version field.
+# Marks the record with its version if it exists, and creates nothing otherwise.
+_MARK_RECORD_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    redis.call("HSET", KEYS[1], ARGV[1], 1)
+end
+"""
+
+# KEYS: interview record, then the time, status, warning and user keys it
+# replaced. ARGV: now, duration in seconds, inactive status, record TTL in
+# seconds. Sets the start time on first use, renews the record TTL while the
+# interview runs and returns the interview phase, where the 80 and 90 percent
+# phases are returned only once, when the warning is due. A record created
+# here, with no old keys to move, is marked with the record version.
+_CHECK_TIME_SCRIPT = """
+local start = redis.call("HGET", KEYS[1], "time") or redis.call("GET", KEYS[2])
+if not start then
+    start = ARGV[1]
+    redis.call("HSET", KEYS[1], "time", start)
+    if redis.call("EXISTS", KEYS[5]) == 0 then
+        redis.call("HSET", KEYS[1], "version", 1)
+    end
+    redis.call("EXPIRE", KEYS[1], ARGV[4])
+end
+
+local elapsed = tonumber(ARGV[1]) - tonumber(start)
+local duration = tonumber(ARGV[2])
+local status = redis.call("HGET", KEYS[1], "status") or redis.call("GET", KEYS[3])
+
+if elapsed >= duration or status == ARGV[3] then
+    return "ended"
+end
+
+redis.call("EXPIRE", KEYS[1], ARGV[4])
+
+local phase = 0
+if elapsed >= duration * 0.9 then
+    phase = 90
+elseif elapsed >= duration * 0.8 then
+    phase = 80
+end
+
+local warning = redis.call("HGET", KEYS[1], "warning") or redis.call("GET", KEYS[4])
+if phase > tonumber(warning or "0") then
+    redis.call("HSET", KEYS[1], "warning", phase)
+    return tostring(phase)
+end
+
+return "normal"
+"""
+
+
+# KEYS: report lease, fencing counter, report job.
+# ARGV: lease TTL in milliseconds, job, fencing counter TTL in seconds.
+# Takes the lease with SET NX PX under a new fencing token, and sets the job
+# with the same TTL, returning the token or nil if the lease is held.
+_ACQUIRE_LEASE_SCRIPT = """
+local token = redis.call("INCR", KEYS[2])
+redis.call("EXPIRE", KEYS[2], ARGV[3])
+
+if not redis.call("SET", KEYS[1], token, "NX", "PX", ARGV[1]) then
+    return nil
+end
+
+redis.call("SET", KEYS[3], ARGV[2], "PX", ARGV[1])
+return token
+"""
+
+# KEYS: report lease, report job. ARGV: fencing token, lease TTL in milliseconds.
+# Extends the lease and the job, returning 0 if the token lost the lease.
+_RENEW_LEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+
+redis.call("PEXPIRE", KEYS[1], ARGV[2])
+redis.call("PEXPIRE", KEYS[2], ARGV[2])
+return 1
+"""
+
+# KEYS: report lease, report job, report channel.
+# ARGV: fencing token, job status, job, retry delay in milliseconds.
+# Releases the lease, or keeps it with the failed job until the retry delay,
+# and notifies the waiters, returning 0 if the token lost the lease.
+_RELEASE_LEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+
+if ARGV[3] == "" then
+    redis.call("DEL", KEYS[1], KEYS[2])
+else
+    redis.call("SET", KEYS[2], ARGV[3], "PX", ARGV[4])
+    redis.call("PEXPIRE", KEYS[1], ARGV[4])
+end
+
+redis.call("PUBLISH", KEYS[3], ARGV[2])
+return 1
+"""
+
+# KEYS: report lease, interview record. ARGV: fencing token, feedback.
+# Stores the feedback only while the token holds the lease.
+_SET_FEEDBACK_FENCED_SCRIPT = """
+if redis.call("GET", KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+
+redis.call("HSET", KEYS[2], "feedback", ARGV[2])
+return 1
+"""
 
 
 class RedisService:
     """Service to interact with Redis."""
 
-    __client = Union[Redis, None]
-    """Redis client instance."""
+    __client: Union[Redis, None] = None
+    """Async Redis client instance."""
+
+    __sync_client: Union[SyncRedis, None] = None
+    """Sync Redis client instance, used by the LangChain chat history."""
+
+    __check_time_script = None
+    """Registered time check script, run with EVALSHA."""
+
+    __scripts: dict = {}
+    """Other registered scripts, by source."""
 
     class Namespace(StrEnum):
         """Namespace for Redis keys."""
@@ -38,6 +183,39 @@ class RedisService:
         INTERVIEW_TYPE = "interview_type"
         """Namespace for interview type-related keys."""
 
+        ANSWER_FEEDBACK = "answer_feedback"
+        """Namespace for per-answer feedback-related keys."""
+
+        RESUME_TEXT = "resume_text"
+        """Namespace for parsed resume text-related keys."""
+
+        RESUME_DOWNLOAD = "resume_download"
+        """Namespace for resume download validator-related keys."""
+
+        WARNING = "warning"
+        """Namespace for time warning-related keys."""
+
+        SUMMARY = "summary"
+        """Namespace for chat history summary-related keys."""
+
+        INTERVIEW = "interview"
+        """Namespace for interview record keys, a hash of the fields above."""
+
+        REAPER = "reaper"
+        """Namespace for the interviews to evict, by report publishing time."""
+
+        REPORT_JOB = "report_job"
+        """Namespace for report generation job-related keys."""
+
+        REPORT_LEASE = "report_lease"
+        """Namespace for report generation lease keys, holding a fencing token."""
+
+        REPORT_FENCE = "report_fence"
+        """Namespace for the last fencing token of report generation leases."""
+
+        REPORT_DONE = "report_done"
+        """Namespace for the channels notifying the end of report generation."""
+
     class Status(StrEnum):
         """Status values for Redis keys."""
 
@@ -47,6 +225,21 @@ class RedisService:
         INACTIVE = "inactive"
         """Inactive status."""
 
+    class Phase(StrEnum):
+        """Phase values of the interview time check."""
+
+        NORMAL = "normal"
+        """Normal phase, or a warning that was already given."""
+
+        WARNING_80 = "80"
+        """80 percent of the time has passed, warning not given yet."""
+
+        WARNING_90 = "90"
+        """90 percent of the time has passed, warning not given yet."""
+
+        ENDED = "ended"
+        """Time is up or the interview was ended."""
+
     class InterviewType(StrEnum):
         """Interview type values for Redis keys."""
 
@@ -59,128 +252,508 @@ class RedisService:
     @staticmethod
     def connect():
         """Connect to Redis."""
-        RedisService.__client = Redis.from_url(REDIS_URL)
+        RedisService.__check_time_script = None
+        RedisService.__scripts = {}
+        RedisService.__client = Redis(
+            connection_pool=BlockingConnectionPool.from_url(
+                REDIS_URL,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                timeout=REDIS_POOL_TIMEOUT,
+            )
+        )
+        RedisService.__sync_client = SyncRedis(
+            connection_pool=SyncBlockingConnectionPool.from_url(
+                REDIS_URL,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                timeout=REDIS_POOL_TIMEOUT,
+            )
+        )
 
     @staticmethod
-    def disconnect():
+    async def disconnect():
         """Disconnect from Redis."""
+        RedisService.__check_time_script = None
+        RedisService.__scripts = {}
+
         if RedisService.__client is not None:
-            RedisService.__client.close()
+            await RedisService.__client.aclose()
             RedisService.__client = None
 
+        if RedisService.__sync_client is not None:
+            RedisService.__sync_client.close()
+            RedisService.__sync_client = None
+
     @staticmethod
     def get_client() -> Redis:
-        """Get Redis client."""
+        """Get async Redis client."""
         if RedisService.__client is None:
             RedisService.connect()
 
         return RedisService.__client
 
     @staticmethod
-    def get(key) -> ResponseT:
+    def get_sync_client() -> SyncRedis:
+        """Get sync Redis client."""
+        if RedisService.__sync_client is None:
+            RedisService.connect()
+
+        return RedisService.__sync_client
+
+    @staticmethod
+    async def get(key) -> ResponseT:
         """Get a value from Redis."""
-        return RedisService.get_client().get(key)
+        return await RedisService.get_client().get(key)
 
     @staticmethod
-    def set(key, value) -> None:
+    async def set(key, value) -> None:
         """Set a value in Redis."""
-        RedisService.get_client().set(key, value)
+        await RedisService.get_client().set(key, value)
 
     @staticmethod
-    def setKeyWithNamespace(namespace, key, value) -> None:
+    async def setKeyWithNamespace(namespace, key, value) -> None:
         """Set a value in Redis with a namespace."""
-        RedisService.get_client().set(f"{namespace}:{key}", value)
+        await RedisService.get_client().set(f"{namespace}:{key}", value)
 
     @staticmethod
-    def getKeyWithNamespace(namespace, key) -> ResponseT:
+    async def getKeyWithNamespace(namespace, key) -> ResponseT:
         """Get a value from Redis with a namespace."""
-        return RedisService.get_client().get(f"{namespace}:{key}")
+        return await RedisService.get_client().get(f"{namespace}:{key}")
+
+    @staticmethod
+    def _record_key(key) -> str:
+        """Get the key of the interview record."""
+        return f"{RedisService.Namespace.INTERVIEW}:{key}"
+
+    @staticmethod
+    async def set_fields(key, mapping: dict) -> None:
+        """Set fields of the interview record, keeping its TTL if it has one."""
+        async with RedisService.get_client().pipeline(transaction=True) as pipe:
+            pipe.hset(RedisService._record_key(key), mapping=mapping)
+            pipe.expire(RedisService._record_key(key), INTERVIEW_TTL, nx=True)
+            await pipe.execute()
+
+    @staticmethod
+    async def get_fields(key, *fields: Namespace) -> list[ResponseT]:
+        """Get fields of the interview record in one round trip."""
+        *values, version = await RedisService.get_client().hmget(
+            RedisService._record_key(key), [*fields, _RECORD_VERSION_FIELD]
+        )
+
+        if version is None:
+            record = await RedisService._migrate_record(key)
+            values = [
+                value if value is not None else record.get(field)
+                for field, value in zip(fields, values)
+            ]
+
+        return values
+
+    @staticmethod
+    async def _migrate_record(key) -> dict:
+        """Move the keys of an interview stored before the record was used.
+
+        Fields already set in the record are newer and kept. Returns the
+        fields found in the old keys. An existing record is marked with its
+        version even when there is nothing to move, so this is only attempted
+        once for it.
+        """
+        client = RedisService.get_client()
+        legacy_keys = [f"{field}:{key}" for field in _RECORD_FIELDS]
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.mget(legacy_keys)
+            # Feedback was stored as a JSON document, which MGET reads as nil
+            pipe.json().get(f"{RedisService.Namespace.FEEDBACK}:{key}")
+            values, feedback = await pipe.execute()
+
+        record = {
+            field: value
+            for field, value in zip(_RECORD_FIELDS, values)
+            if value is not None
+        }
+        if feedback is not None:
+            record[RedisService.Namespace.FEEDBACK] = json.dumps(feedback)
+
+        if not record:
+            # Reads must not create keys, so only an existing record is marked
+            await RedisService._get_script(_MARK_RECORD_SCRIPT)(
+                keys=[RedisService._record_key(key)], args=[_RECORD_VERSION_FIELD]
+            )
+            return record
+
+        async with client.pipeline(transaction=True) as pipe:
+            for field, value in record.items():
+                pipe.hsetnx(RedisService._record_key(key), field, value)
+            pipe.hset(RedisService._record_key(key), _RECORD_VERSION_FIELD, 1)
+            pipe.expire(RedisService._record_key(key), INTERVIEW_TTL)
+            pipe.delete(*legacy_keys)
+            await pipe.execute()
+
+        return record
+
+    @staticmethod
+    def get_interview_keys(key) -> list[str]:
+        """Get the keys holding the state of the interview, besides its history."""
+        return [
+            RedisService._record_key(key),
+            f"{RedisService.Namespace.ANSWER_FEEDBACK}:{key}",
+        ]
+
+    @staticmethod
+    async def expire_keys(keys: list[str], ttl: int) -> None:
+        """Set the TTL of keys in one round trip."""
+        async with RedisService.get_client().pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.expire(key, ttl)
+            await pipe.execute()
+
+    @staticmethod
+    async def delete_keys(keys: list[str]) -> int:
+        """Delete keys, returning the bytes of memory they used."""
+        if not keys:
+            return 0
+
+        async with RedisService.get_client().pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.memory_usage(key)
+            pipe.delete(*keys)
+            *usages, deleted = await pipe.execute(raise_on_error=False)
+
+        if isinstance(deleted, Exception):
+            raise deleted
+
+        # MEMORY USAGE may be disabled on managed Redis, counted as 0 then
+        return sum(usage for usage in usages if isinstance(usage, int))
+
+    @staticmethod
+    async def add_reapable(key, published_at: float) -> None:
+        """Add an interview to evict, by report publishing time."""
+        await RedisService.get_client().zadd(
+            RedisService.Namespace.REAPER, {key: published_at}
+        )
+
+    @staticmethod
+    async def get_reapable(published_before: float, count: int) -> list[str]:
+        """Get interviews whose report was published before the given time."""
+        keys = await RedisService.get_client().zrangebyscore(
+            RedisService.Namespace.REAPER, "-inf", published_before, start=0, num=count
+        )
+        return [key.decode("utf-8") for key in keys]
+
+    @staticmethod
+    async def claim_reapable(key) -> bool:
+        """Claim an interview to evict, False if another instance claimed it."""
+        return bool(
+            await RedisService.get_client().zrem(RedisService.Namespace.REAPER, key)
+        )
+
+    @staticmethod
+    async def set_details(
+        key,
+        user: str,
+        job_description: str,
+        resume: str,
+        interview_type: InterviewType,
+    ) -> None:
+        """Set the interview details in the interview record."""
+        await RedisService.set_fields(
+            key,
+            {
+                RedisService.Namespace.USER: user,
+                RedisService.Namespace.JOB_DESCRIPTION: job_description,
+                RedisService.Namespace.RESUME: resume,
+                RedisService.Namespace.INTERVIEW_TYPE: interview_type,
+                _RECORD_VERSION_FIELD: 1,
+            },
+        )
+
+    @staticmethod
+    async def get_details(key, *fields: Namespace) -> dict[str, Union[str, None]]:
+        """Get decoded fields of the interview record, by field."""
+        values = await RedisService.get_fields(key, *fields)
+        return {
+            field: value.decode("utf-8") if isinstance(value, bytes) else value
+            for field, value in zip(fields, values)
+        }
 
     @staticmethod
-    def set_time(key, value) -> None:
+    async def set_time(key, value) -> None:
         """Set a time-related value in Redis."""
-        RedisService.setKeyWithNamespace(RedisService.Namespace.TIME, key, value)
+        await RedisService.set_fields(key, {RedisService.Namespace.TIME: value})
 
     @staticmethod
-    def get_time(key) -> ResponseT:
+    async def get_time(key) -> ResponseT:
         """Get a time-related value from Redis."""
-        return RedisService.getKeyWithNamespace(RedisService.Namespace.TIME, key)
+        (value,) = await RedisService.get_fields(key, RedisService.Namespace.TIME)
+        return value
 
     @staticmethod
-    def set_status(key, value) -> None:
+    async def set_status(key, value) -> None:
         """Set a status-related value in Redis."""
-        RedisService.setKeyWithNamespace(RedisService.Namespace.STATUS, key, value)
+        await RedisService.set_fields(key, {RedisService.Namespace.STATUS: value})
 
     @staticmethod
-    def get_status(key) -> Union[str, None]:
+    async def get_status(key) -> Union[str, None]:
         """Get a status-related value from Redis."""
-        raw = RedisService.getKeyWithNamespace(RedisService.Namespace.STATUS, key)
-        return raw.decode("utf-8") if raw else None
+        details = await RedisService.get_details(key, RedisService.Namespace.STATUS)
+        return details[RedisService.Namespace.STATUS]
 
     @staticmethod
-    def set_user(key, value) -> None:
+    async def set_user(key, value) -> None:
         """Set a user-related value in Redis."""
-        RedisService.setKeyWithNamespace(RedisService.Namespace.USER, key, value)
+        await RedisService.set_fields(key, {RedisService.Namespace.USER: value})
 
     @staticmethod
-    def get_user(key) -> ResponseT:
+    async def get_user(key) -> Union[str, None]:
         """Get a user-related value from Redis."""
-        raw = RedisService.getKeyWithNamespace(RedisService.Namespace.USER, key)
-        return raw.decode("utf-8") if raw else None
+        details = await RedisService.get_details(key, RedisService.Namespace.USER)
+        return details[RedisService.Namespace.USER]
 
     @staticmethod
-    def set_job_description(key, value) -> None:
+    async def set_job_description(key, value) -> None:
         """Set a job description-related value in Redis."""
-        RedisService.setKeyWithNamespace(
-            RedisService.Namespace.JOB_DESCRIPTION, key, value
+        await RedisService.set_fields(
+            key, {RedisService.Namespace.JOB_DESCRIPTION: value}
         )
 
     @staticmethod
-    def get_job_description(key) -> ResponseT:
+    async def get_job_description(key) -> Union[str, None]:
         """Get a job description-related value from Redis."""
-        raw = RedisService.getKeyWithNamespace(
-            RedisService.Namespace.JOB_DESCRIPTION, key
+        details = await RedisService.get_details(
+            key, RedisService.Namespace.JOB_DESCRIPTION
         )
-        return raw.decode("utf-8") if raw else None
+        return details[RedisService.Namespace.JOB_DESCRIPTION]
 
     @staticmethod
-    def set_resume(key, value) -> None:
+    async def set_resume(key, value) -> None:
         """Set a resume-related value in Redis."""
-        RedisService.setKeyWithNamespace(RedisService.Namespace.RESUME, key, value)
+        await RedisService.set_fields(key, {RedisService.Namespace.RESUME: value})
 
     @staticmethod
-    def get_resume(key) -> ResponseT:
+    async def get_resume(key) -> Union[str, None]:
         """Get a resume-related value from Redis."""
-        raw = RedisService.getKeyWithNamespace(RedisService.Namespace.RESUME, key)
-        return raw.decode("utf-8") if raw else None
+        details = await RedisService.get_details(key, RedisService.Namespace.RESUME)
+        return details[RedisService.Namespace.RESUME]
 
     @staticmethod
-    def set_feedback(key, value: dict) -> None:
+    async def set_feedback(key, value: dict) -> None:
         """Set a feedback-related value in Redis."""
-        RedisService.get_client().json().set(
-            f"{RedisService.Namespace.FEEDBACK}:{key}", Path.root_path(), value
+        await RedisService.set_fields(
+            key, {RedisService.Namespace.FEEDBACK: json.dumps(value)}
         )
 
     @staticmethod
-    def get_feedback(key) -> dict:
+    async def get_feedback(key) -> Union[dict, None]:
         """Get a feedback-related value from Redis."""
-        return (
-            RedisService.get_client()
-            .json()
-            .get(f"{RedisService.Namespace.FEEDBACK}:{key}")
-        )
+        (raw,) = await RedisService.get_fields(key, RedisService.Namespace.FEEDBACK)
+        return json.loads(raw) if raw else None
 
     @staticmethod
-    def set_interview_type(key, value: InterviewType) -> None:
+    async def set_interview_type(key, value: InterviewType) -> None:
         """Set an interview type-related value in Redis."""
-        RedisService.setKeyWithNamespace(
-            RedisService.Namespace.INTERVIEW_TYPE, key, value
+        await RedisService.set_fields(
+            key, {RedisService.Namespace.INTERVIEW_TYPE: value}
         )
 
     @staticmethod
-    def get_interview_type(key) -> InterviewType:
+    async def get_interview_type(key) -> InterviewType:
         """Get an interview type-related value from Redis."""
-        raw = RedisService.getKeyWithNamespace(
-            RedisService.Namespace.INTERVIEW_TYPE, key
+        details = await RedisService.get_details(
+            key, RedisService.Namespace.INTERVIEW_TYPE
+        )
+        return (
+            details[RedisService.Namespace.INTERVIEW_TYPE]
+            or RedisService.InterviewType.NORMAL
+        )
+
+    @staticmethod
+    async def set_answer_feedback(key, index: int, value: dict) -> None:
+        """Set the feedback of a single answer, keeping the TTL if it has one."""
+        answer_feedback_key = f"{RedisService.Namespace.ANSWER_FEEDBACK}:{key}"
+        async with RedisService.get_client().pipeline(transaction=True) as pipe:
+            pipe.hset(answer_feedback_key, index, json.dumps(value))
+            pipe.expire(answer_feedback_key, INTERVIEW_TTL, nx=True)
+            await pipe.execute()
+
+    @staticmethod
+    async def get_answer_feedbacks(key) -> dict[int, dict]:
+        """Get the feedback of every scored answer from Redis, by answer index."""
+        raw = await RedisService.get_client().hgetall(
+            f"{RedisService.Namespace.ANSWER_FEEDBACK}:{key}"
+        )
+        return {int(index): json.loads(value) for index, value in raw.items()}
+
+    @staticmethod
+    def _get_script(source: str):
+        """Get a script registered on the async client, run with EVALSHA."""
+        if source not in RedisService.__scripts:
+            RedisService.__scripts[source] = RedisService.get_client().register_script(
+                source
+            )
+
+        return RedisService.__scripts[source]
+
+    @staticmethod
+    def _report_keys(key) -> list[str]:
+        """Get the lease and job keys of a report."""
+        return [
+            f"{RedisService.Namespace.REPORT_LEASE}:{key}",
+            f"{RedisService.Namespace.REPORT_JOB}:{key}",
+        ]
+
+    @staticmethod
+    async def acquire_report_lease(key, job: dict, ttl: float) -> Union[int, None]:
+        """Take the report lease for ttl seconds and set its job.
+
+        Returns the fencing token of the lease, or None if it is already held.
+        """
+        lease_key, job_key = RedisService._report_keys(key)
+        token = await RedisService._get_script(_ACQUIRE_LEASE_SCRIPT)(
+            keys=[lease_key, f"{RedisService.Namespace.REPORT_FENCE}:{key}", job_key],
+            args=[int(ttl * 1000), json.dumps(job), INTERVIEW_ENDED_TTL],
+        )
+        return int(token) if token is not None else None
+
+    @staticmethod
+    async def renew_report_lease(key, token: int, ttl: float) -> bool:
+        """Extend the report lease for ttl seconds, False if it was lost."""
+        return bool(
+            await RedisService._get_script(_RENEW_LEASE_SCRIPT)(
+                keys=RedisService._report_keys(key), args=[token, int(ttl * 1000)]
+            )
+        )
+
+    @staticmethod
+    async def release_report_lease(
+        key, token: int, failed_job: Union[dict, None] = None, retry_delay: float = 0
+    ) -> bool:
+        """Release the report lease and notify the waiters.
+
+        A failed job is kept, with the lease, until the retry delay. Returns
+        False if the lease was lost.
+        """
+        status = failed_job["status"] if failed_job else "done"
+        return bool(
+            await RedisService._get_script(_RELEASE_LEASE_SCRIPT)(
+                keys=[
+                    *RedisService._report_keys(key),
+                    f"{RedisService.Namespace.REPORT_DONE}:{key}",
+                ],
+                args=[
+                    token,
+                    status,
+                    json.dumps(failed_job) if failed_job else "",
+                    int(retry_delay * 1000),
+                ],
+            )
+        )
+
+    @staticmethod
+    async def get_report_lease_ttl(key) -> float:
+        """Get the seconds left on the report lease, 0 if it is not held."""
+        lease_key, _ = RedisService._report_keys(key)
+        ttl = await RedisService.get_client().pttl(lease_key)
+        return max(ttl, 0) / 1000
+
+    @staticmethod
+    async def set_feedback_fenced(key, value: dict, token: int) -> bool:
+        """Set the feedback only while token holds the report lease."""
+        lease_key, _ = RedisService._report_keys(key)
+        return bool(
+            await RedisService._get_script(_SET_FEEDBACK_FENCED_SCRIPT)(
+                keys=[lease_key, RedisService._record_key(key)],
+                args=[token, json.dumps(value)],
+            )
+        )
+
+    @staticmethod
+    @asynccontextmanager
+    async def subscribe_report(key) -> AsyncIterator[PubSub]:
+        """Subscribe to the notification of the end of report generation."""
+        pubsub = RedisService.get_client().pubsub()
+        try:
+            await pubsub.subscribe(f"{RedisService.Namespace.REPORT_DONE}:{key}")
+            yield pubsub
+        finally:
+            await pubsub.aclose()
+
+    @staticmethod
+    async def update_report_job(key, value: dict) -> None:
+        """Update a report job in Redis, keeping its TTL."""
+        await RedisService.get_client().set(
+            f"{RedisService.Namespace.REPORT_JOB}:{key}",
+            json.dumps(value),
+            xx=True,
+            keepttl=True,
+        )
+
+    @staticmethod
+    async def get_report_job(key) -> Union[dict, None]:
+        """Get a report job from Redis."""
+        raw = await RedisService.getKeyWithNamespace(
+            RedisService.Namespace.REPORT_JOB, key
+        )
+        return json.loads(raw) if raw else None
+
+    @staticmethod
+    async def set_resume_text(key, value: str, ttl: int) -> None:
+        """Set a parsed resume text-related value in Redis, expiring after ttl."""
+        await RedisService.get_client().set(
+            f"{RedisService.Namespace.RESUME_TEXT}:{key}", value, ex=ttl
+        )
+
+    @staticmethod
+    async def get_resume_text(key) -> Union[str, None]:
+        """Get a parsed resume text-related value from Redis."""
+        raw = await RedisService.getKeyWithNamespace(
+            RedisService.Namespace.RESUME_TEXT, key
+        )
+        return raw.decode("utf-8") if raw else None
+
+    @staticmethod
+    async def set_resume_download(key, value: dict, ttl: int) -> None:
+        """Set a resume download validator-related value in Redis."""
+        await RedisService.get_client().set(
+            f"{RedisService.Namespace.RESUME_DOWNLOAD}:{key}", json.dumps(value), ex=ttl
+        )
+
+    @staticmethod
+    async def get_resume_download(key) -> Union[dict, None]:
+        """Get a resume download validator-related value from Redis."""
+        raw = await RedisService.getKeyWithNamespace(
+            RedisService.Namespace.RESUME_DOWNLOAD, key
+        )
+        return json.loads(raw) if raw else None
+
+    @staticmethod
+    async def set_summary(key, value: dict) -> None:
+        """Set a chat history summary-related value in Redis."""
+        await RedisService.set_fields(
+            key, {RedisService.Namespace.SUMMARY: json.dumps(value)}
+        )
+
+    @staticmethod
+    async def get_summary(key) -> Union[dict, None]:
+        """Get a chat history summary-related value from Redis."""
+        (raw,) = await RedisService.get_fields(key, RedisService.Namespace.SUMMARY)
+        return json.loads(raw) if raw else None
+
+    @staticmethod
+    async def check_time(key, now: float, duration: float) -> Phase:
+        """Set the start time if missing and get the phase in one round trip."""
+        if RedisService.__check_time_script is None:
+            RedisService.__check_time_script = (
+                RedisService.get_client().register_script(_CHECK_TIME_SCRIPT)
+            )
+
+        phase = await RedisService.__check_time_script(
+            keys=[
+                RedisService._record_key(key),
+                f"{RedisService.Namespace.TIME}:{key}",
+                f"{RedisService.Namespace.STATUS}:{key}",
+                f"{RedisService.Namespace.WARNING}:{key}",
+                f"{RedisService.Namespace.USER}:{key}",
+            ],
+            args=[now, duration, RedisService.Status.INACTIVE, INTERVIEW_TTL],
         )
-        return raw.decode("utf-8") if raw else RedisService.InterviewType.NORMAL
+        return RedisService.Phase(phase.decode("utf-8"))
@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import time
+from typing import Union
+
+from app import REPORT_LEASE_TTL, REPORT_RETRY_DELAY
+from app.services.feedback import FeedbackService
+from app.services.lifecycle import LifecycleService
+from app.services.redis import RedisService
+from app.types.interview_report_response import InterviewReportResponse
+from app.types.report_job_response import ReportJobResponse, ReportJobStatus
+
+_jobs: dict[str, asyncio.Task] = {}
+"""Report generation tasks running in this process, by interview ID."""
+
+
+class ReportService:
+    """Service for report generation jobs.
+
+    A job runs under a Redis lease with a fencing token, renewed while it
+    runs, so only one report is generated per interview across replicas,
+    whether requested by the API or an event. Waiters elsewhere are notified
+    on the report channel when the job ends.
+    """
+
+    @staticmethod
+    def _to_response(interview_id: str, job: dict) -> ReportJobResponse:
+        """Get the response of a report job."""
+        return ReportJobResponse(interview_id=interview_id, **job)
+
+    @staticmethod
+    async def _start(interview_id: str) -> dict:
+        """Start generating the report, unless a job is already set for it."""
+        while True:
+            job = {
+                "status": ReportJobStatus.GENERATING,
+                "progress": 0,
+                "total": 0,
+                "started_at": time.time(),
+            }
+            token = await RedisService.acquire_report_lease(
+                interview_id, job, REPORT_LEASE_TTL
+            )
+            if token is not None:
+                task = asyncio.create_task(ReportService._run(interview_id, job, token))
+                _jobs[interview_id] = task
+                task.add_done_callback(
+                    lambda task: ReportService._on_done(interview_id, task)
+                )
+                return job
+
+            # The job may have finished between the claim and the read
+            job = await RedisService.get_report_job(interview_id)
+            if job is not None:
+                return job
+
+    @staticmethod
+    def _on_done(interview_id: str, task: asyncio.Task) -> None:
+        """Forget a finished job, its error is already logged."""
+        _jobs.pop(interview_id, None)
+        if not task.cancelled():
+            task.exception()
+
+    @staticmethod
+    async def _renew(interview_id: str, token: int, job_task: asyncio.Task) -> None:
+        """Renew the lease of a running job, cancelling the job if it is lost."""
+        while True:
+            await asyncio.sleep(REPORT_LEASE_TTL / 3)
+
+            try:
+                renewed = await RedisService.renew_report_lease(
+                    interview_id, token, REPORT_LEASE_TTL
+                )
+            except Exception as err:
+                # Retried on the next renewal, the fencing token guards the report
+                logging.error(f"Error renewing the report lease: {err}")
+                continue
+
+            if not renewed:
+                logging.warning(f"Lost the report lease of interview {interview_id}")
+                job_task.cancel()
+                return
+
+    @staticmethod
+    async def _run(interview_id: str, job: dict, token: int) -> None:
+        """Generate and store the report, tracking its progress in the job."""
+        feedback_service = FeedbackService(interview_id)
+
+        async def on_progress(progress: int, total: int):
+            job.update(progress=progress, total=total)
+            await RedisService.update_report_job(interview_id, job)
+
+        feedback_service.on_progress = on_progress
+        renewal = asyncio.create_task(
+            ReportService._renew(interview_id, token, asyncio.current_task())
+        )
+
+        try:
+            await feedback_service.load_details()
+            await LifecycleService.set_ended(interview_id)
+            if await feedback_service.generate_feedback(token) is None:
+                logging.warning(
+                    f"Report of interview {interview_id} was not stored, "
+                    f"its lease was lost"
+                )
+                return
+
+            await RedisService.release_report_lease(interview_id, token)
+        except Exception as err:
+            # Kept as failed for a while, so a failing report is not retried in a loop
+            logging.error(
+                f"Error generating report for interview {interview_id}: {err}"
+            )
+            job.update(status=ReportJobStatus.FAILED)
+            await RedisService.release_report_lease(
+                interview_id, token, job, REPORT_RETRY_DELAY
+            )
+            raise
+        finally:
+            renewal.cancel()
+
+    @staticmethod
+    async def get_report(
+        interview_id: str,
+    ) -> Union[InterviewReportResponse, ReportJobResponse]:
+        """Get the report of an ended interview, or its job while generating."""
+        feedback_service = FeedbackService(interview_id)
+        await feedback_service.initialize()
+
+        feedback = await feedback_service.get_feedback()
+        if feedback is not None:
+            return feedback
+
+        job = await ReportService._start(interview_id)
+        return ReportService._to_response(interview_id, job)
+
+    @staticmethod
+    async def generate(interview_id: str) -> InterviewReportResponse:
+        """Get the report of an ended interview, waiting for it to be generated.
+
+        A failed job is retried once its retry delay is over, until it succeeds.
+        """
+        feedback_service = FeedbackService(interview_id)
+        await feedback_service.initialize()
+
+        # Subscribed before checking, so the end of the job cannot be missed
+        async with RedisService.subscribe_report(interview_id) as pubsub:
+            while True:
+                feedback = await feedback_service.get_feedback()
+                if feedback is not None:
+                    return feedback
+
+                job = await ReportService._start(interview_id)
+
+                task = _jobs.get(interview_id)
+                if task is not None:
+                    # Not cancelled with the waiter, its failure is read back
+                    # from the job
+                    await asyncio.wait([task])
+                elif job["status"] == ReportJobStatus.FAILED:
+                    # Retried once the failed job expires, rather than failing
+                    # the event, which the broker would redeliver at once
+                    retry_delay = await RedisService.get_report_lease_ttl(interview_id)
+                    logging.info(
+                        f"Report of interview {interview_id} failed, "
+                        f"retrying in {retry_delay:.0f}s"
+                    )
+                    await asyncio.sleep(retry_delay)
+                else:
+                    # Notified when the job ends, or checked again once the
+                    # lease of a crashed replica has expired
+                    await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=REPORT_LEASE_TTL
+                    )
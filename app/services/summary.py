@@ -0,0 +1,71 @@
+import asyncio
+import logging
+
+from langchain_core.messages import get_buffer_string
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
+
+from app.services.chat_history import ChatHistoryService
+from app.services.redis import RedisService
+from app.services.system_messages import conversation_summary
+from app.utils.llm import LLMClient
+
+_summary_prompt = PromptTemplate(
+    template=conversation_summary
+    + "\nCurrent summary: {summary}\nNew messages:\n{messages}",
+    input_variables=["summary", "messages"],
+)
+
+_summarizing: set[str] = set()
+"""Interviews whose history is being summarised in the background."""
+
+
+class SummaryService:
+    """Service for folding older conversation turns into a rolling summary."""
+
+    @staticmethod
+    async def update_summary(interview_id: str, window: int) -> None:
+        """Fold the messages before the last window turns into the summary.
+
+        Messages are folded once a whole window of them is pending, so the
+        prompt holds between one and two windows of turns verbatim and the
+        summary is updated once every window turns.
+        """
+        if interview_id in _summarizing:
+            return
+
+        _summarizing.add(interview_id)
+
+        try:
+            history, summary = await asyncio.gather(
+                ChatHistoryService.aget_history(interview_id),
+                RedisService.get_summary(interview_id),
+            )
+            summary = summary or {"summary": "", "count": 0}
+
+            total = await asyncio.to_thread(len, history)
+            pending = total - summary["count"] - window * 2
+            if pending < window * 2:
+                return
+
+            messages = await asyncio.to_thread(
+                ChatHistoryService.query_messages, history, summary["count"], pending
+            )
+            chain = _summary_prompt | LLMClient.get() | StrOutputParser()
+            text = await chain.ainvoke(
+                {
+                    "summary": summary["summary"] or "None",
+                    "messages": get_buffer_string(
+                        messages, human_prefix="Candidate", ai_prefix="Interviewer"
+                    ),
+                }
+            )
+
+            await RedisService.set_summary(
+                interview_id,
+                {"summary": text, "count": summary["count"] + len(messages)},
+            )
+        except Exception as err:
+            logging.error(f"Error summarising interview {interview_id}: {err}")
+        finally:
+            _summarizing.discard(interview_id)
@@ -1,3 +1,5 @@
+from typing import Union
+
 from langchain_core.messages import BaseMessage
 from pydantic import BaseModel
 
@@ -13,6 +15,10 @@ class ConversationResponse(BaseModel):
     def from_message(cls, message: BaseMessage) -> "ConversationResponse":
         return cls(message=message.content, type=message.type)
 
+    @classmethod
+    def from_pair(cls, type: str, message: str) -> "ConversationResponse":
+        return cls(message=message, type=type)
+
 
 class InterviewDetailsResponse(BaseModel):
     interview_id: str
@@ -20,3 +26,17 @@ class InterviewDetailsResponse(BaseModel):
 
     conversations: list[ConversationResponse]
     """The conversations."""
+
+    next_cursor: Union[str, None] = None
+    """The cursor of the next page, None on the last page."""
+
+
+class CompactInterviewDetailsResponse(BaseModel):
+    interview_id: str
+    """The interview ID."""
+
+    conversations: list[tuple[str, str]]
+    """The conversations, as type and message pairs."""
+
+    next_cursor: Union[str, None] = None
+    """The cursor of the next page, None on the last page."""
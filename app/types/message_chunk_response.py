@@ -0,0 +1,17 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class MessageChunkType(StrEnum):
+    CHUNK = "chunk"
+    END = "end"
+    ERROR = "error"
+
+
+class MessageChunkResponse(BaseModel):
+    type: MessageChunkType
+    """The type of the chunk."""
+
+    message: str
+    """The streamed text, or the complete reply for the end chunk."""
@@ -0,0 +1,25 @@
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class ReportJobStatus(StrEnum):
+    GENERATING = "generating"
+    FAILED = "failed"
+
+
+class ReportJobResponse(BaseModel):
+    interview_id: str
+    """The interview ID."""
+
+    status: ReportJobStatus
+    """The status of the report generation."""
+
+    progress: int
+    """The number of answers scored so far."""
+
+    total: int
+    """The number of answers to score, 0 until known."""
+
+    started_at: float
+    """The time generation started, in seconds since the epoch."""
@@ -1,3 +1,7 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+
 import boto3
 
 from app import (
@@ -7,6 +11,11 @@ from app import (
     AWS_SECRET_ACCESS_KEY,
     SPEECH_PROVIDERS,
 )
+from app.utils.cache import TTLCache
+
+_CREDENTIALS_DURATION = 30 * 60
+# Credentials are handed out only while they have this long left to live
+_CREDENTIALS_MARGIN = 5 * 60
 
 
 class AwsCredentialsGenerator:
@@ -18,16 +27,53 @@ class AwsCredentialsGenerator:
                 aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
                 region_name=AWS_REGION,
             )
+        self._credentials: TTLCache[dict] = TTLCache(
+            maxsize=1000, ttl=_CREDENTIALS_DURATION - _CREDENTIALS_MARGIN
+        )
+        self._pending: dict[str, asyncio.Task] = {}
 
-    def generate_credentials(self, interview_id: str = ""):
-        if "aws" not in SPEECH_PROVIDERS:
-            return None
+    def _assume_role(self, interview_id: str):
         try:
             assumed_role = self.sts_client.assume_role(
                 RoleArn=AWS_ROLE_ARN,
                 RoleSessionName=interview_id,
-                DurationSeconds=30 * 60,
+                DurationSeconds=_CREDENTIALS_DURATION,
             )
             return assumed_role.get("Credentials")
         except Exception as e:
+            logging.error(f"Error generating AWS credentials: {e}")
             return None
+
+    async def _fetch_credentials(self, interview_id: str):
+        try:
+            credentials = await asyncio.to_thread(self._assume_role, interview_id)
+            if not credentials:
+                return None
+
+            ttl = _CREDENTIALS_DURATION - _CREDENTIALS_MARGIN
+            if credentials.get("Expiration"):
+                expires_in = credentials["Expiration"] - datetime.now(timezone.utc)
+                ttl = expires_in.total_seconds() - _CREDENTIALS_MARGIN
+
+            if ttl > 0:
+                self._credentials.set(interview_id, credentials, ttl)
+
+            return credentials
+        finally:
+            self._pending.pop(interview_id, None)
+
+    async def generate_credentials(self, interview_id: str = ""):
+        if "aws" not in SPEECH_PROVIDERS:
+            return None
+
+        credentials = self._credentials.get(interview_id)
+        if credentials:
+            return credentials
+
+        # Concurrent requests for the same interview share one STS call
+        task = self._pending.get(interview_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_credentials(interview_id))
+            self._pending[interview_id] = task
+
+        return await asyncio.shield(task)
@@ -1,24 +1,67 @@
-import requests
+import asyncio
+import logging
+import time
+from typing import Union
+
+import aiohttp
 
 from app import AZURE_KEY, AZURE_REGION, SPEECH_PROVIDERS
+from app.utils.http import HttpClient
+
+# Azure speech tokens are valid for 10 minutes
+_TOKEN_REFRESH_AFTER = 8 * 60
+_TOKEN_EXPIRE_AFTER = 9 * 60
 
 
 class AzureTokenGenerator:
     def __init__(self):
-        self.endpoint = (
-            f"https://{AZURE_REGION}.api.cognitive.microsoft.com/sts/v1.0/issueToken"
-        )
         self.headers = {
             "Ocp-Apim-Subscription-Key": AZURE_KEY,
             "Content-Type": "application/x-www-form-urlencoded",
         }
+        self._tokens: dict[str, tuple[str, float]] = {}
+        self._refreshes: dict[str, asyncio.Task] = {}
 
-    def generate_token(self):
-        if "azure" not in SPEECH_PROVIDERS:
-            return None
+    def _endpoint(self, region: str) -> str:
+        return f"https://{region}.api.cognitive.microsoft.com/sts/v1.0/issueToken"
+
+    async def _fetch_token(self, region: str) -> Union[str, None]:
         try:
-            response = requests.post(self.endpoint, headers=self.headers)
-            response.raise_for_status()  # Raise an error for bad responses
-            return response.text
-        except requests.exceptions.RequestException:
+            session = await HttpClient.connect()
+            async with session.post(
+                self._endpoint(region), headers=self.headers
+            ) as response:
+                response.raise_for_status()
+                token = await response.text()
+
+            self._tokens[region] = (token, time.monotonic())
+            return token
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.error(f"Error generating Azure token: {e!r}")
             return None
+        finally:
+            self._refreshes.pop(region, None)
+
+    def _refresh(self, region: str) -> asyncio.Task:
+        # Concurrent callers share the in-flight request instead of starting one
+        task = self._refreshes.get(region)
+        if task is None:
+            task = asyncio.create_task(self._fetch_token(region))
+            self._refreshes[region] = task
+        return task
+
+    async def generate_token(self, region: str = AZURE_REGION):
+        if "azure" not in SPEECH_PROVIDERS:
+            return None
+
+        cached = self._tokens.get(region)
+        if cached:
+            token, fetched_at = cached
+            age = time.monotonic() - fetched_at
+
+            if age < _TOKEN_EXPIRE_AFTER:
+                if age >= _TOKEN_REFRESH_AFTER:
+                    self._refresh(region)
+                return token
+
+        return await asyncio.shield(self._refresh(region))
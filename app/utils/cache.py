@@ -0,0 +1,61 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """In-process LRU cache whose entries expire after a time-to-live."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        """Maximum number of entries kept, least recently used are evicted."""
+
+        self.ttl = ttl
+        """Time-to-live of an entry in seconds."""
+
+        self.hits = 0
+        """Number of lookups served from the cache."""
+
+        self.misses = 0
+        """Number of lookups not found or expired."""
+
+        self._entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Union[T, None]:
+        """Get a value from the cache, or None if missing or expired."""
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] <= time.monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: T, ttl: float = None) -> None:
+        """Set a value in the cache, evicting the least recently used entries."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a value from the cache."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Get the cache size and hit/miss counters."""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
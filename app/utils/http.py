@@ -0,0 +1,34 @@
+import logging
+
+import aiohttp
+
+from app import HTTP_POOL_SIZE, HTTP_TIMEOUT
+
+
+class HttpClient:
+    """Shared HTTP client session with pooled keep-alive connections"""
+
+    _session = None
+
+    @classmethod
+    async def connect(cls) -> aiohttp.ClientSession:
+        """Create the shared client session"""
+
+        if cls._session and not cls._session.closed:
+            return cls._session
+
+        cls._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+        )
+        logging.info("Created HTTP client session")
+        return cls._session
+
+    @classmethod
+    async def close(cls):
+        """Close the shared client session"""
+
+        if cls._session:
+            await cls._session.close()
+            cls._session = None
+            logging.info("Closed HTTP client session")
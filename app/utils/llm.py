@@ -0,0 +1,79 @@
+import asyncio
+import logging
+
+import httpx
+from langchain_core.language_models import BaseChatModel
+
+from app import (
+    GROQ_API_KEY,
+    GROQ_MODEL,
+    LLM_POOL_SIZE,
+    LLM_WARM_UP_TIMEOUT,
+    MODEL,
+    OLLAMA_KEEP_ALIVE,
+    OLLAMA_NUM_CTX,
+    USE_GROQ,
+)
+
+
+class LLMClient:
+    """Shared chat model client, created on first use"""
+
+    _llm = None
+
+    @classmethod
+    def get(cls) -> BaseChatModel:
+        """Get the shared chat model client of the configured provider"""
+
+        if cls._llm is None:
+            cls._llm = cls._create()
+            logging.info("Created LLM client")
+
+        return cls._llm
+
+    @staticmethod
+    def _create() -> BaseChatModel:
+        """Create the chat model client, importing only the configured provider"""
+
+        limits = httpx.Limits(
+            max_connections=LLM_POOL_SIZE, max_keepalive_connections=LLM_POOL_SIZE
+        )
+
+        if USE_GROQ:
+            from langchain_groq import ChatGroq
+
+            return ChatGroq(
+                model=GROQ_MODEL,
+                api_key=GROQ_API_KEY,
+                http_async_client=httpx.AsyncClient(limits=limits),
+            )
+
+        from langchain_ollama import ChatOllama
+
+        return ChatOllama(
+            model=MODEL,
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            num_ctx=OLLAMA_NUM_CTX,
+            async_client_kwargs={"limits": limits},
+        )
+
+    @classmethod
+    async def warm_up(cls):
+        """Create the client and, for Ollama, load the model before any request"""
+
+        llm = cls.get()
+        if USE_GROQ:
+            return
+
+        try:
+            # One generated token is enough to load the model into memory
+            await asyncio.wait_for(
+                llm.ainvoke(
+                    "Hello",
+                    options={"num_ctx": OLLAMA_NUM_CTX, "num_predict": 1},
+                ),
+                LLM_WARM_UP_TIMEOUT,
+            )
+            logging.info("Warmed up LLM model")
+        except Exception as err:
+            logging.warning(f"Could not warm up LLM model: {err!r}")
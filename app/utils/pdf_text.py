@@ -1,18 +1,162 @@
+import asyncio
+import hashlib
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
+from typing import NamedTuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 import aiohttp
 from PyPDF2 import PdfReader
 
+from app import PDF_CACHE_TTL, PDF_MAX_SIZE, PDF_TIMEOUT, PDF_WORKERS
+from app.services.redis import RedisService
+from app.utils.http import HttpClient
+
+_executor = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # Forking the server could copy locks held by its other threads
+        _executor = ProcessPoolExecutor(
+            max_workers=PDF_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _executor
+
+
+def close_executor():
+    """Shut down the PDF parsing processes."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _recycle_executor(executor: ProcessPoolExecutor):
+    """Kill the processes of an executor with a hung parse, replacing it.
+
+    Parses running in the other processes fail and are not cached.
+    """
+    global _executor
+    if _executor is executor:
+        _executor = None
+
+    # Shutting down alone waits for the running parses, which never end
+    if hasattr(executor, "kill_workers"):
+        executor.kill_workers()
+        return
+
+    # Before Python 3.14 the workers are only reachable through _processes,
+    # a CPython implementation detail
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.kill()
+
+
+def _extract_text(pdf_content: bytes) -> str:
+    """Extract the text of every page, run in a worker process."""
+    reader = PdfReader(BytesIO(pdf_content))
+    return "".join(page.extract_text() for page in reader.pages)
+
+
+# Query parameters of presigned S3, GCS, CloudFront and Azure SAS URLs, which
+# change whenever the same file is signed again
+_SIGNATURE_PARAMS = {
+    "awsaccesskeyid",
+    "expires",
+    "key-pair-id",
+    "policy",
+    "signature",
+    "se",
+    "sig",
+    "skoid",
+    "sks",
+    "skt",
+    "sktid",
+    "ske",
+    "skv",
+    "sp",
+    "spr",
+    "sr",
+    "st",
+    "sv",
+}
+_SIGNATURE_PARAM_PREFIXES = ("x-amz-", "x-goog-")
+
+
+def _is_signature_param(name: str) -> bool:
+    name = name.lower()
+    return name in _SIGNATURE_PARAMS or name.startswith(_SIGNATURE_PARAM_PREFIXES)
+
+
+def _url_key(pdf_url: str) -> str:
+    """Key a URL without its signature, so re-signed links share a key.
+
+    Other query parameters are kept, as they may select the file.
+    """
+    url = urlsplit(pdf_url)
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(url.query, keep_blank_values=True)
+        if not _is_signature_param(name)
+    )
+    url = url._replace(query=urlencode(query), fragment="").geturl()
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+def _cache_key(url_key: str, pdf_content: bytes) -> str:
+    """Key the parsed text by the URL and the content."""
+    content_hash = hashlib.sha256(pdf_content).hexdigest()
+    return hashlib.sha256(f"{url_key}\n{content_hash}".encode()).hexdigest()
+
+
+class PdfDownload(NamedTuple):
+    content: Union[bytes, None]
+    """The PDF content, None when not modified since the last download."""
+
+    etag: Union[str, None]
+    """The ETag response header."""
+
+    last_modified: Union[str, None]
+    """The Last-Modified response header."""
+
+
+async def fetch_pdf(pdf_url, validators: dict = None) -> Union[PdfDownload, None]:
+    headers = {}
+    if validators and validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators and validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
 
-async def fetch_pdf(pdf_url):
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(pdf_url) as response:
-                response.raise_for_status()
-                pdf_content = await response.read()
+        session = await HttpClient.connect()
+        async with session.get(pdf_url, headers=headers) as response:
+            if response.status == 304:
+                return PdfDownload(None, None, None)
+
+            response.raise_for_status()
+
+            if response.content_length and response.content_length > PDF_MAX_SIZE:
+                logging.error(f"PDF too large: {response.content_length} bytes")
+                return
+
+            pdf_content = bytearray()
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                pdf_content.extend(chunk)
+                if len(pdf_content) > PDF_MAX_SIZE:
+                    logging.error(f"PDF too large: over {PDF_MAX_SIZE} bytes")
+                    return
 
-        return pdf_content
+        return PdfDownload(
+            bytes(pdf_content),
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
     except aiohttp.ClientError as e:
         logging.error(f"Error downloading the PDF: {e}")
         return
@@ -21,22 +165,61 @@ async def fetch_pdf(pdf_url):
 async def fetch_pdf_text(pdf_url):
     logging.info(f"Fetching PDF text from: {pdf_url}")
     try:
-        pdf_content = await fetch_pdf(pdf_url)
-        if isinstance(pdf_content, str):
-            return pdf_content
+        url_key = _url_key(pdf_url)
+        validators = await RedisService.get_resume_download(url_key)
 
-        if not pdf_content:
+        download = await fetch_pdf(pdf_url, validators)
+
+        if download and download.content is None:
+            # The text is only reused if it was parsed from this very file
+            text = (
+                await RedisService.get_resume_text(validators["text_key"])
+                if validators.get("url_key") == url_key
+                else None
+            )
+            if text is not None:
+                logging.info(f"Using cached PDF text, not modified: {pdf_url}")
+                return text
+
+            download = await fetch_pdf(pdf_url)
+
+        if not download or not download.content:
             return
 
-        pdf_file = BytesIO(pdf_content)
-        reader = PdfReader(pdf_file)
+        key = _cache_key(url_key, download.content)
+        text = await RedisService.get_resume_text(key)
+        if text is None:
+            executor = _get_executor()
+            try:
+                text = await asyncio.wait_for(
+                    asyncio.get_running_loop().run_in_executor(
+                        executor, _extract_text, download.content
+                    ),
+                    PDF_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                _recycle_executor(executor)
+                raise
+            await RedisService.set_resume_text(key, text, PDF_CACHE_TTL)
+        else:
+            logging.info(f"Using cached PDF text for: {pdf_url}")
 
-        text = ""
-        for page_num in range(len(reader.pages)):
-            page = reader.pages[page_num]
-            text += page.extract_text()
+        if download.etag or download.last_modified:
+            await RedisService.set_resume_download(
+                url_key,
+                {
+                    "etag": download.etag,
+                    "last_modified": download.last_modified,
+                    "text_key": key,
+                    "url_key": url_key,
+                },
+                PDF_CACHE_TTL,
+            )
 
         return text
+    except asyncio.TimeoutError:
+        logging.error(f"Timed out processing the PDF: {pdf_url}")
+        return
     except Exception as e:
         logging.error(f"Error processing the PDF: {e}")
         return
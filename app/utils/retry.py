@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class RetryPolicy:
+    """Bounded retry policy with exponential backoff, jitter and a time budget."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 10.0,
+        attempt_timeout: float = 60.0,
+        budget: float = 180.0,
+    ):
+        self.max_attempts = max_attempts
+        """Maximum number of attempts, including the first one."""
+
+        self.base_delay = base_delay
+        """Backoff delay before the first retry in seconds, doubled on each retry."""
+
+        self.max_delay = max_delay
+        """Upper bound of the backoff delay in seconds."""
+
+        self.attempt_timeout = attempt_timeout
+        """Timeout of a single attempt in seconds."""
+
+        self.budget = budget
+        """Total time allowed for all attempts and backoffs in seconds."""
+
+    def _backoff(self, retry: int) -> float:
+        """Get the jittered backoff delay before the given retry."""
+        delay = min(self.max_delay, self.base_delay * 2**retry)
+        return random.uniform(delay / 2, delay)
+
+    async def run(
+        self,
+        func: Callable[[], Awaitable[T]],
+        is_valid: Callable[[T], bool] = lambda _: True,
+        name: str = "call",
+    ) -> tuple[Union[T, None], int]:
+        """
+        Run a coroutine function until it returns a valid result
+
+        Parameters
+        ----------
+        func : Callable[[], Awaitable[T]]
+            The coroutine function to run on each attempt
+        is_valid : Callable[[T], bool], optional
+            Whether a result is acceptable, by default every result is
+        name : str, optional
+            The name of the call used in logs, by default "call"
+
+        Returns
+        -------
+        tuple[T | None, int]
+            The valid result, or None once the attempts or budget run out,
+            and the number of retries made
+
+        Examples
+        --------
+        >>> await RetryPolicy(max_attempts=3).run(chain_call, lambda r: bool(r))
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.budget
+        retries = 0
+
+        for attempt in range(self.max_attempts):
+            if attempt > 0:
+                delay = self._backoff(attempt - 1)
+                if loop.time() + delay >= deadline:
+                    break
+
+                await asyncio.sleep(delay)
+                retries += 1
+
+            timeout = min(self.attempt_timeout, deadline - loop.time())
+
+            try:
+                result = await asyncio.wait_for(func(), timeout)
+                if is_valid(result):
+                    return result, retries
+
+                logging.warning(f"Invalid result for {name} on attempt {attempt + 1}")
+            except asyncio.TimeoutError:
+                logging.warning(f"Timed out {name} on attempt {attempt + 1}")
+            except Exception as err:
+                logging.warning(f"Failed {name} on attempt {attempt + 1}: {err}")
+
+        logging.error(f"Giving up {name} after {retries + 1} attempts")
+        return None, retries
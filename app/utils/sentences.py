@@ -0,0 +1,20 @@
+import re
+from typing import AsyncIterator
+
+_SENTENCE_BOUNDARY = re.compile(r"((?<=[.!?])\s+|\n+)")
+
+
+async def split_sentences(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Regroup streamed text chunks into whole sentences, ready for TTS."""
+    buffer = ""
+
+    async for chunk in chunks:
+        buffer += chunk
+        *parts, buffer = _SENTENCE_BOUNDARY.split(buffer)
+
+        # Keep the boundary with its sentence so the joined output is unchanged
+        for sentence, boundary in zip(parts[::2], parts[1::2]):
+            yield sentence + boundary
+
+    if buffer:
+        yield buffer
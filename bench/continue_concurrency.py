@@ -0,0 +1,61 @@
+"""Time concurrent /continue calls against a model with a fixed latency.
+
+With the chain and the chat history awaited rather than run in threads,
+N concurrent turns of different interviews complete in about one model
+latency.
+
+    python -m bench.continue_concurrency --concurrency 50 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.app_v1 import app
+from app.services.redis import RedisService
+from bench import stubs
+
+
+async def main(concurrency: int, latency: float) -> None:
+    stubs.use_fake_redis()
+    stubs.use_model(latency)
+    stubs.use_memory_history()
+    stubs.stub_events()
+
+    interview_ids = [f"bench-{index}" for index in range(concurrency)]
+    for interview_id in interview_ids:
+        await RedisService.set_details(
+            interview_id, "user_id", "Backend engineer", "Python developer", "normal"
+        )
+        await RedisService.set_status(interview_id, RedisService.Status.ACTIVE)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def turn(interview_id: str) -> int:
+            response = await client.post(
+                f"/conversations/continue/{interview_id}",
+                json={"message": "I have five years of experience."},
+            )
+            return response.status_code
+
+        start = time.perf_counter()
+        statuses = await asyncio.gather(*[turn(id) for id in interview_ids])
+        elapsed = time.perf_counter() - start
+
+    print(f"{concurrency} concurrent turns, model latency {latency:.2f}s")
+    print(f"statuses: {sorted(set(statuses))}")
+    print(f"total: {elapsed:.2f}s ({elapsed / latency:.1f}x the model latency)")
+    print(f"run one at a time: at least {concurrency * latency:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.latency))
@@ -0,0 +1,95 @@
+"""Count the prompt tokens the model processes per turn of an interview.
+
+The prompt of every turn starts with the same prefix, the guidelines, job
+description and resume, so a model keeping its prompt cache loaded only
+processes the tokens after the prefix shared with the previous turn. This
+compares that with processing the whole prompt on every turn, as happens
+when the model is unloaded between turns. No model server is needed.
+
+Tokens are counted with the model's tokenizer when available, and otherwise
+estimated at 4 characters per token.
+
+    python -m bench.prompt_tokens --turns 20
+"""
+
+import argparse
+import os
+import warnings
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+from app.services.chain import ChainService
+from app.utils.llm import LLMClient
+
+_JOB_DESCRIPTION = (
+    "Backend engineer to build and operate Python services on FastAPI, Redis "
+    "and RabbitMQ, owning their reliability and performance in production. "
+) * 4
+_RESUME = (
+    "Five years of Python development, designing REST APIs, tuning Postgres "
+    "queries and running services on Kubernetes for a payments company. "
+) * 8
+_QUESTION = (
+    "Can you describe a production incident you handled, and what you changed after it?"
+)
+_ANSWER = "We had a queue backlog after a deploy. I rolled back, added a consumer lag alert and load tested the next release."
+
+
+def _render(messages: list[BaseMessage]) -> str:
+    """Render the prompt as the text the model is given, role by role."""
+    return "".join(f"{message.type}: {message.content}\n" for message in messages)
+
+
+def _get_token_counter():
+    """Count with the model's tokenizer, or estimate if it is not installed."""
+    llm = LLMClient.get()
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            llm.get_num_tokens("tokenizer check")
+        return llm.get_num_tokens, "tokenizer"
+    except ImportError:
+        return lambda text: (len(text) + 3) // 4, "estimated, 4 characters per token"
+
+
+def _shared_prefix_length(previous: str, current: str) -> int:
+    return len(os.path.commonprefix([previous, current]))
+
+
+def main(turns: int) -> None:
+    count_tokens, counting = _get_token_counter()
+    prompt = ChainService(_JOB_DESCRIPTION, _RESUME).get_prompt()
+
+    history: list[BaseMessage] = []
+    previous = ""
+    total_full, total_cached = 0, 0
+
+    print(f"tokens counted: {counting}")
+    print(f"{'turn':>4} {'uncached':>9} {'cached':>7}")
+    for turn in range(1, turns + 1):
+        text = _render(prompt.format_messages(history=history, input=_ANSWER))
+
+        full = count_tokens(text)
+        cached = count_tokens(text[_shared_prefix_length(previous, text) :])
+        total_full += full
+        total_cached += cached
+        print(f"{turn:>4} {full:>9} {cached:>7}")
+
+        history += [HumanMessage(content=_ANSWER), AIMessage(content=_QUESTION)]
+        previous = text
+
+    # Everything before the new input of the first turn
+    prefix = _render(prompt.format_messages(history=[], input=""))
+    prefix = prefix[: prefix.rindex(f"{HumanMessage(content='').type}: ")]
+    print(f"stable prefix: {count_tokens(prefix)} tokens")
+    print(
+        f"total processed: {total_full} uncached, {total_cached} cached "
+        f"({1 - total_cached / total_full:.0%} less)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+    main(args.turns)
@@ -0,0 +1,51 @@
+"""Time RPC requests against a stub broker with a fixed round-trip time.
+
+The reply queue and its channel are declared once and shared, so each
+request costs one publish plus the wait for the reply.
+
+    python -m bench.rpc_overhead --requests 200 --rtt 0.002
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.services.broker.rpc import RPCService
+from bench import stubs
+
+
+async def main(requests: int, concurrency: int, rtt: float) -> None:
+    broker = stubs.use_broker(rtt)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(index: int) -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            await RPCService.request("BENCH_RPC", {"index": index})
+            return time.perf_counter() - start
+
+    # The first request declares the shared reply queue
+    await request(-1)
+    broker.round_trips = 0
+
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*[request(index) for index in range(requests)])
+    elapsed = time.perf_counter() - start
+    await RPCService.close()
+
+    # A request is at least its publish and the reply, two round trips
+    mean = sum(latencies) / len(latencies)
+    print(f"{requests} requests, {concurrency} at a time, rtt {rtt * 1000:.1f}ms")
+    print(f"broker round trips per request: {broker.round_trips / requests:.2f}")
+    print(f"mean latency: {mean * 1000:.2f}ms, floor {2 * rtt * 1000:.2f}ms")
+    print(f"overhead per request: {(mean - 2 * rtt) * 1000:.2f}ms")
+    print(f"total: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--rtt", type=float, default=0.002)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.rtt))
@@ -0,0 +1,85 @@
+"""Time /start against stub services with fixed latencies.
+
+The interview details and the resume URL are requested concurrently, the
+details are written to Redis in one transaction without a read-back, and
+the report is scheduled while the model writes the greeting.
+
+    python -m bench.start_latency --interviews 20 --rtt 0.005 --latency 0.3
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+import jwt
+
+import app.services.interview as interview_module
+from app import JWT_SECRET_KEY
+from app.app_v1 import app
+from app.services.broker.rpc import RPCService
+from app.types.communications import RPCPayloadType
+from bench import stubs
+
+_USER_ID = "bench-user"
+
+
+def _use_services(rtt: float, pdf_latency: float) -> None:
+    """Answer the interview and user RPCs, and parse resumes, after a delay."""
+
+    async def request(service_rpc: str, payload: dict, timeout: int = 10) -> dict:
+        await asyncio.sleep(rtt)
+        if payload["type"] == RPCPayloadType.GET_USER_RESUME:
+            return {"data": "https://bench/resume.pdf"}
+
+        return {"data": {"userid": _USER_ID, "jobdescription": "Backend engineer"}}
+
+    async def fetch_pdf_text(pdf_url: str) -> str:
+        await asyncio.sleep(pdf_latency)
+        return "Five years of Python development."
+
+    RPCService.request = staticmethod(request)
+    interview_module.fetch_pdf_text = fetch_pdf_text
+
+
+async def main(interviews: int, rtt: float, pdf_latency: float, latency: float):
+    stubs.use_fake_redis()
+    stubs.use_model(latency, "Hello, tell me about yourself.")
+    stubs.use_memory_history()
+    stubs.stub_events(rtt)
+    _use_services(rtt, pdf_latency)
+
+    token = jwt.encode({"sub": _USER_ID}, JWT_SECRET_KEY, algorithm="HS256")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+        headers={"authorization": f"Bearer {token}"},
+    ) as client:
+        latencies = []
+        for index in range(interviews):
+            start = time.perf_counter()
+            response = await client.post(f"/conversations/start/bench-{index}")
+            latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+
+    # RPCs, resume, model and the start events, one after the other
+    floor = rtt + pdf_latency + latency + rtt
+    print(
+        f"{interviews} interviews, rtt {rtt * 1000:.0f}ms, resume "
+        f"{pdf_latency * 1000:.0f}ms, model {latency * 1000:.0f}ms"
+    )
+    print(f"median /start: {statistics.median(latencies) * 1000:.0f}ms")
+    print(f"max /start: {max(latencies) * 1000:.0f}ms")
+    print(f"dependency floor: {floor * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--interviews", type=int, default=20)
+    parser.add_argument("--rtt", type=float, default=0.005)
+    parser.add_argument("--pdf-latency", type=float, default=0.05)
+    parser.add_argument("--latency", type=float, default=0.3)
+    args = parser.parse_args()
+    asyncio.run(main(args.interviews, args.rtt, args.pdf_latency, args.latency))
@@ -0,0 +1,87 @@
+"""Time the import of the app and its first request, in fresh processes.
+
+The LLM provider is imported and its client created on first use, so
+neither slows down the import of the app. The first request to a route
+that does not use the model is served without loading a provider. The
+lifespan, which connects to Redis and RabbitMQ, is not run.
+
+    python -m bench.startup --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+_PROVIDERS = ("langchain_groq", "langchain_ollama")
+
+
+def _child() -> None:
+    """Measure one start-up, run in a fresh interpreter."""
+    start = time.perf_counter()
+    from app.main import app
+
+    imported = time.perf_counter()
+    loaded_at_import = [name for name in _PROVIDERS if name in sys.modules]
+
+    import httpx
+
+    async def first_request() -> int:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            return (await client.get("/v1/")).status_code
+
+    status = asyncio.run(first_request())
+    served = time.perf_counter()
+
+    from app.utils.llm import LLMClient
+
+    LLMClient.get()
+    client_created = time.perf_counter()
+
+    print(
+        json.dumps(
+            {
+                "import": imported - start,
+                "first_request": served - start,
+                "llm_client": client_created - served,
+                "status": status,
+                "loaded_at_import": loaded_at_import,
+            }
+        )
+    )
+
+
+def main(runs: int) -> None:
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-m", "bench.startup", "--child"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    def median_ms(name: str) -> float:
+        return statistics.median(result[name] for result in results) * 1000
+
+    print(f"{runs} runs, medians")
+    print(f"import app.main: {median_ms('import'):.0f}ms")
+    print(f"first request served: {median_ms('first_request'):.0f}ms after start")
+    print(f"LLM client on first use: {median_ms('llm_client'):.0f}ms")
+    print(f"first request status: {results[0]['status']}")
+    print(f"providers loaded at import: {results[0]['loaded_at_import'] or 'none'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    _child() if args.child else main(args.runs)
@@ -0,0 +1,126 @@
+import asyncio
+from types import SimpleNamespace
+
+import fakeredis.aioredis
+from langchain_core.chat_history import InMemoryChatMessageHistory
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from app.services.broker import Broker
+from app.services.broker.events import EventService
+from app.services.chat_history import ChatHistoryService
+from app.services.redis import RedisService
+from app.utils.llm import LLMClient
+
+
+class SlowChatModel(FakeListChatModel):
+    """Chat model answering after a fixed latency, like a model server."""
+
+    latency: float = 0.5
+
+    async def _agenerate(self, *args, **kwargs):
+        await asyncio.sleep(self.latency)
+        return await super()._agenerate(*args, **kwargs)
+
+
+def use_fake_redis() -> fakeredis.aioredis.FakeRedis:
+    """Point the Redis service at an in-process fake Redis."""
+    client = fakeredis.aioredis.FakeRedis()
+    RedisService._RedisService__client = client
+    return client
+
+
+def use_model(latency: float, reply: str = "Tell me about yourself.") -> None:
+    """Answer every prompt with the same reply after latency seconds."""
+    LLMClient._llm = SlowChatModel(responses=[reply], latency=latency)
+
+
+def use_memory_history() -> dict[str, InMemoryChatMessageHistory]:
+    """Keep chat histories in memory, as fakeredis has no RediSearch."""
+    histories = {}
+
+    async def aget_history(interview_id: str):
+        return histories.setdefault(interview_id, InMemoryChatMessageHistory())
+
+    ChatHistoryService.aget_history = staticmethod(aget_history)
+    return histories
+
+
+def stub_events(latency: float = 0) -> list[dict]:
+    """Record published events instead of sending them to RabbitMQ."""
+    published = []
+
+    async def publish(queue: str, payload: dict):
+        await asyncio.sleep(latency)
+        published.append(payload)
+
+    EventService.publish = staticmethod(publish)
+    return published
+
+
+class StubBroker:
+    """In-process broker taking rtt seconds per round trip, replying to RPCs.
+
+    Counts the round trips made, to compare the work done per request.
+    """
+
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.round_trips = 0
+        self._consumers = {}
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.rtt)
+
+    async def connect(self):
+        return self
+
+    async def channel(self):
+        await self._round_trip()
+        return _StubChannel(self)
+
+
+class _StubQueue:
+    def __init__(self, broker: StubBroker, name: str):
+        self.broker = broker
+        self.name = name
+
+    async def consume(self, callback, no_ack: bool = False):
+        await self.broker._round_trip()
+        self.broker._consumers[self.name] = callback
+
+
+class _StubExchange:
+    def __init__(self, broker: StubBroker):
+        self.broker = broker
+
+    async def publish(self, message, routing_key: str):
+        await self.broker._round_trip()
+        asyncio.create_task(self._reply(message))
+
+    async def _reply(self, message):
+        # The called service answers with the payload it was sent
+        await asyncio.sleep(self.broker.rtt)
+        await self.broker._consumers[message.reply_to](
+            SimpleNamespace(correlation_id=message.correlation_id, body=message.body)
+        )
+
+
+class _StubChannel:
+    def __init__(self, broker: StubBroker):
+        self.broker = broker
+        self.default_exchange = _StubExchange(broker)
+
+    async def declare_queue(self, name: str = "", **kwargs):
+        await self.broker._round_trip()
+        return _StubQueue(self.broker, name or f"amq.gen-{id(self)}")
+
+    async def close(self):
+        await self.broker._round_trip()
+
+
+def use_broker(rtt: float) -> StubBroker:
+    """Point the broker at an in-process stub with rtt seconds per round trip."""
+    broker = StubBroker(rtt)
+    Broker.connect = staticmethod(broker.connect)
+    return broker